@@ -9,7 +9,7 @@ This module defines the SQLAlchemy ORM models for the application:
 
 from datetime import UTC, datetime
 from enum import StrEnum
-from uuid import uuid4
+from uuid import uuid7
 
 from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -36,7 +36,7 @@ class Item(Base):
     Attributes
     ----------
     id : str
-        UUID primary key
+        UUIDv7 primary key
     language : Language
         Language of the text (ru, de, en)
     text : str
@@ -51,7 +51,7 @@ class Item(Base):
     __table_args__ = (Index("ix_items_text_language", "text", "language", unique=True),)
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        String(36), primary_key=True, default=lambda: str(uuid7())
     )
     language: Mapped[Language] = mapped_column(String(2), nullable=False)
     text: Mapped[str] = mapped_column(String, nullable=False)
@@ -75,7 +75,7 @@ class Session(Base):
     Attributes
     ----------
     id : str
-        UUID primary key
+        UUIDv7 primary key
     language : Language
         Language of the session (ru, de, en)
     started_at : datetime
@@ -89,7 +89,7 @@ class Session(Base):
     __tablename__ = "sessions"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        String(36), primary_key=True, default=lambda: str(uuid7())
     )
     language: Mapped[Language] = mapped_column(String(2), nullable=False)
     started_at: Mapped[datetime] = mapped_column(
@@ -109,7 +109,7 @@ class SessionItem(Base):
     Attributes
     ----------
     id : str
-        UUID primary key
+        UUIDv7 primary key
     session_id : str
         Foreign key to Session
     item_id : str
@@ -131,7 +131,7 @@ class SessionItem(Base):
     __tablename__ = "session_items"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        String(36), primary_key=True, default=lambda: str(uuid7())
     )
     session_id: Mapped[str] = mapped_column(
         String(36), ForeignKey("sessions.id"), nullable=False
@@ -159,7 +159,7 @@ class Illustration(Base):
     Attributes
     ----------
     id : str
-        UUID primary key
+        UUIDv7 primary key
     source_url : str | None
         Original URL if imported from web
     width : int
@@ -177,7 +177,7 @@ class Illustration(Base):
     __tablename__ = "illustrations"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        String(36), primary_key=True, default=lambda: str(uuid7())
     )
     source_url: Mapped[str | None] = mapped_column(String, nullable=True)
     width: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -199,7 +199,7 @@ class ItemIllustration(Base):
     Attributes
     ----------
     id : str
-        UUID primary key
+        UUIDv7 primary key
     item_id : str
         Foreign key to Item
     illustration_id : str
@@ -221,7 +221,7 @@ class ItemIllustration(Base):
     )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        String(36), primary_key=True, default=lambda: str(uuid7())
     )
     item_id: Mapped[str] = mapped_column(
         String(36), ForeignKey("items.id"), nullable=False
@@ -1,11 +1,14 @@
 """Image processing utilities."""
 
+import asyncio
+import errno
+import os
 from io import BytesIO
 from pathlib import Path  # noqa: TC003
 from typing import NamedTuple
 
 import httpx
-from PIL import Image
+from PIL import Image, UnidentifiedImageError
 
 
 class ImageProcessingError(Exception):
@@ -24,6 +27,19 @@ class InsufficientStorageError(ImageProcessingError):
     """Raised when disk space is insufficient."""
 
 
+# Minimum ratio between the size after the box-filter reduction and the target size
+_RESIZE_REDUCING_GAP = 3.0
+
+# Pillow format names for the image content types that clients commonly send
+_CONTENT_TYPE_FORMATS = {
+    "image/bmp": "BMP",
+    "image/gif": "GIF",
+    "image/jpeg": "JPEG",
+    "image/png": "PNG",
+    "image/webp": "WEBP",
+}
+
+
 class ProcessedImage(NamedTuple):
     """A single processed image variant."""
 
@@ -32,6 +48,25 @@ class ProcessedImage(NamedTuple):
     height: int
 
 
+def format_from_content_type(content_type: str | None) -> str | None:
+    """Map an image content type to a Pillow format name, or None if unknown."""
+    if content_type is None:
+        return None
+    return _CONTENT_TYPE_FORMATS.get(content_type.split(";")[0].strip().lower())
+
+
+def _open_image(image_data: bytes, hint_format: str | None) -> Image.Image:
+    """Open image bytes, trying the hinted format before full format detection."""
+    if hint_format is not None:
+        try:
+            return Image.open(BytesIO(image_data), formats=(hint_format,))
+        except UnidentifiedImageError, KeyError:
+            # The input is mislabelled or Pillow does not know the hinted format name,
+            # so ignore the hint and probe every format instead
+            pass
+    return Image.open(BytesIO(image_data))
+
+
 def _resize_image(image: Image.Image, max_dimension: int) -> Image.Image:
     """Resize image maintaining aspect ratio if either dimension exceeds max."""
     width, height = image.size
@@ -46,7 +81,13 @@ def _resize_image(image: Image.Image, max_dimension: int) -> Image.Image:
         new_height = max_dimension
         new_width = int(width * (max_dimension / height))
 
-    return image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    # A reducing gap lets Pillow shrink the image by an integer factor with a cheap
+    # box filter before the Lanczos pass, which stays visually indistinguishable
+    return image.resize(
+        (new_width, new_height),
+        Image.Resampling.LANCZOS,
+        reducing_gap=_RESIZE_REDUCING_GAP,
+    )
 
 
 def _convert_to_webp(image: Image.Image, quality: int) -> bytes:
@@ -59,32 +100,93 @@ def _convert_to_webp(image: Image.Image, quality: int) -> bytes:
     return output.getvalue()
 
 
+def _write_file(path: Path, data: bytes) -> None:
+    """Write bytes to path with a single unbuffered write.
+
+    Where supported, disk blocks are reserved up front so that a full disk is
+    reported before any data is copied.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        if data and hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(fd, 0, len(data))
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
 def save_image_file(path: Path, data: bytes) -> None:
     """Save image bytes to path, creating parent directories if needed."""
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_bytes(data)
+        _write_file(path, data)
     except OSError as e:
-        if e.errno == 28:  # ENOSPC: No space left on device  # noqa: PLR2004
+        if e.errno == errno.ENOSPC:
             msg = "Not enough disk space"
             raise InsufficientStorageError(msg) from e
         raise
 
 
-async def fetch_image_from_url(url: str) -> bytes:
-    """Fetch image data from URL. Caller should wrap with asyncio.timeout()."""
+async def save_image_file_async(path: Path, data: bytes) -> None:
+    """Save image bytes to path from async code without blocking the event loop.
+
+    Runs save_image_file in a worker thread. A single stdlib write in a thread is
+    cheaper than chunked async file I/O for image-sized payloads.
+    """
+    await asyncio.to_thread(save_image_file, path, data)
+
+
+class _SharedClient:
+    """Holder for the HTTP client shared by all downloads, created on first use."""
+
+    def __init__(self) -> None:
+        self.client: httpx.AsyncClient | None = None
+
+
+_shared_client = _SharedClient()
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    if _shared_client.client is None:
+        _shared_client.client = httpx.AsyncClient()
+    return _shared_client.client
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client, if it was ever created."""
+    if _shared_client.client is not None:
+        await _shared_client.client.aclose()
+        _shared_client.client = None
+
+
+async def fetch_image_from_url(
+    url: str, *, client: httpx.AsyncClient | None = None
+) -> bytes:
+    """Fetch image data from URL. Caller should wrap with asyncio.timeout().
+
+    Uses a shared client by default so that repeated downloads from the same host
+    reuse keep-alive connections.
+    """
+    if client is None:
+        client = _get_client()
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, follow_redirects=True)
-            response.raise_for_status()
-            return response.content
+        response = await client.get(url, follow_redirects=True)
+        response.raise_for_status()
     except httpx.HTTPError as e:
         msg = f"Could not fetch image from URL: {e}"
         raise ImageDownloadError(msg) from e
+    return response.content
 
 
 def process_image(
-    image_data: bytes, max_dimension: int, quality: int
+    image_data: bytes,
+    max_dimension: int,
+    quality: int,
+    *,
+    hint_format: str | None = None,
 ) -> ProcessedImage:
     """Process image: resize to max dimension and convert to WebP.
 
@@ -97,6 +199,9 @@ def process_image(
         while maintaining aspect ratio. Images smaller than this are not upscaled.
     quality : int
         WebP quality level (0-100)
+    hint_format : str | None
+        Expected Pillow format name (e.g. "JPEG"), if known. It is tried first so that
+        Pillow can skip probing other formats; other formats are still accepted.
 
     Returns
     -------
@@ -108,8 +213,57 @@ def process_image(
     InvalidImageError
         If image format is invalid, unsupported, or file is too large to process.
     """
+    image = _decode_image(image_data, hint_format)
+    return _encode_variant(image, max_dimension, quality)
+
+
+def process_image_with_thumbnail(
+    image_data: bytes,
+    max_dimension: int,
+    thumbnail_max_dimension: int,
+    quality: int,
+    *,
+    hint_format: str | None = None,
+) -> tuple[ProcessedImage, ProcessedImage]:
+    """Process image into a full-size variant and a thumbnail.
+
+    The source is decoded only once, and the thumbnail is derived from the resized
+    full-size image rather than from the original.
+
+    Parameters
+    ----------
+    image_data : bytes
+        Raw image bytes in any supported format (JPEG, PNG, WebP, etc.)
+    max_dimension : int
+        Maximum width or height of the full-size variant
+    thumbnail_max_dimension : int
+        Maximum width or height of the thumbnail
+    quality : int
+        WebP quality level (0-100)
+    hint_format : str | None
+        Expected Pillow format name (e.g. "JPEG"), if known
+
+    Returns
+    -------
+    tuple[ProcessedImage, ProcessedImage]
+        Full-size image and thumbnail, both as WebP.
+
+    Raises
+    ------
+    InvalidImageError
+        If image format is invalid, unsupported, or file is too large to process.
+    """
+    image = _decode_image(image_data, hint_format)
+    resized = _resize_image(image, max_dimension)
+    full_image = _encode_variant(resized, max_dimension, quality)
+    thumbnail = _encode_variant(resized, thumbnail_max_dimension, quality)
+    return full_image, thumbnail
+
+
+def _decode_image(image_data: bytes, hint_format: str | None) -> Image.Image:
+    """Open and fully decode image bytes, raising InvalidImageError on failure."""
     try:
-        image = Image.open(BytesIO(image_data))
+        image = _open_image(image_data, hint_format)
     except Exception as e:
         msg = "Invalid or unsupported image format"
         raise InvalidImageError(msg) from e
@@ -121,9 +275,14 @@ def process_image(
         msg = "Image file too large to process"
         raise InvalidImageError(msg) from e
 
-    # Resize and convert
+    return image
+
+
+def _encode_variant(
+    image: Image.Image, max_dimension: int, quality: int
+) -> ProcessedImage:
+    """Resize decoded image to max dimension and convert it to WebP."""
     resized = _resize_image(image, max_dimension)
     width, height = resized.size
     webp_data = _convert_to_webp(resized, quality)
-
     return ProcessedImage(data=webp_data, width=width, height=height)
@@ -1,16 +1,20 @@
 """Language processing for Russian text."""
 
+from functools import lru_cache
+
 from rusyll import rusyll
 
+_PUNCTUATION_TABLE = str.maketrans("", "", ".,!?;:\"'")
+
 
 def sanitize(text: str) -> str:
     """Remove punctuation from text, preserving dashes for compound words."""
-    return text.translate(str.maketrans("", "", ".,!?;:\"'"))
+    return text.translate(_PUNCTUATION_TABLE)
 
 
 def tokenize(text: str) -> list[str]:
     """Split text into words on whitespace."""
-    return [w for w in text.split() if w]
+    return text.split()
 
 
 def syllabify(word: str) -> list[str]:
@@ -37,8 +41,18 @@ def syllabify(word: str) -> list[str]:
     >>> syllabify("123")
     ['123']
 
+    """
+    return list(_syllabify(word))
+
+
+@lru_cache(maxsize=8192)
+def _syllabify(word: str) -> tuple[str, ...]:
+    """Split a word into syllables, caching the result.
+
+    The session state re-syllabifies every word on each broadcast, so the same words
+    are processed many times. Returns a tuple so that the cached value is immutable.
     """
     has_cyrillic = any("\u0400" <= c <= "\u04ff" for c in word)
     if has_cyrillic:
-        return rusyll.word_to_syllables_wd(word)
-    return [word]
+        return tuple(rusyll.word_to_syllables_wd(word))
+    return (word,)
@@ -1,12 +1,14 @@
 """FastAPI application entry point."""
 
 import logging
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from fastapi import FastAPI, Query, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
 
+from chitai.image_processing import close_shared_client
 from chitai.server.grace_timer import GraceTimer
 from chitai.server.routers import (
     illustrations_router,
@@ -20,12 +22,20 @@ from chitai.server.websocket.state import broadcast_state
 from chitai.settings import settings
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
     from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 
-app = FastAPI(title="Chitai")
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Release shared resources on shutdown."""
+    yield
+    await close_shared_client()
+
+
+app = FastAPI(title="Chitai", lifespan=_lifespan)
 
 
 @dataclass
@@ -35,7 +35,9 @@ class GraceTimer:
         self.grace_period_seconds = grace_period_seconds
         self._on_expire = on_expire
         self._last_refresh: datetime | None = None
-        self._task: asyncio.Task[None] | None = None
+        self._handle: asyncio.TimerHandle | None = None
+        self._expire_task: asyncio.Task[None] | None = None
+        self._finished: asyncio.Future[None] | None = None
 
     @property
     def last_refresh(self) -> datetime | None:
@@ -44,38 +46,80 @@ class GraceTimer:
 
     @property
     def is_running(self) -> bool:
-        """True if the timer is currently counting down."""
-        return self._task is not None and not self._task.done()
+        """True if the timer is counting down or its on_expire callback is running."""
+        return self._handle is not None or self._expire_task is not None
 
     def refresh(self) -> None:
         """Record a refresh and restart the countdown.
 
-        Each call resets the countdown to the full grace period.
+        Each call resets the countdown to the full grace period. The countdown is a
+        plain loop timer rather than a task, since refresh() runs on every client
+        message.
         """
         self._last_refresh = datetime.now(UTC)
-        if self._task is not None and not self._task.done():
-            self._task.cancel()
-        self._task = asyncio.create_task(self._run())
+        self._cancel()
+        self._handle = asyncio.get_running_loop().call_later(
+            self.grace_period_seconds, self._expire
+        )
         logger.debug("Grace timer refreshed")
 
+    async def wait(self) -> None:
+        """Wait for the current countdown to finish.
+
+        Returns once the timer has expired and the on_expire callback has completed,
+        or once the countdown is cancelled by refresh() or stop(). Returns immediately
+        if the timer is not running.
+        """
+        if not self.is_running:
+            return
+        if self._finished is None:
+            self._finished = asyncio.get_running_loop().create_future()
+        await asyncio.wait({self._finished})
+
     def stop(self) -> None:
         """Stop the timer. Idempotent."""
-        if self._task is not None and not self._task.done():
-            self._task.cancel()
-        self._task = None
+        self._cancel()
         logger.debug("Grace timer stopped")
 
-    async def _run(self) -> None:
-        """Background task that waits for grace period then calls on_expire."""
-        try:
-            await asyncio.sleep(self.grace_period_seconds)
-            logger.info("Grace period expired, calling on_expire callback")
-            # _last_refresh is always set by refresh() before _run() is created,
-            # so this should never be None in practice.
-            if self._last_refresh is None:
-                return
-            await self._on_expire(self._last_refresh)
-            self._task = None
-        except asyncio.CancelledError:
+    def _cancel(self) -> None:
+        """Cancel the pending countdown or running callback and release waiters."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._expire_task is not None:
+            self._expire_task.cancel()
+            self._expire_task = None
             logger.debug("Grace timer cancelled")
-            raise
+        self._notify_finished()
+
+    def _expire(self) -> None:
+        """Loop callback that starts on_expire once the grace period has elapsed."""
+        self._handle = None
+        logger.info("Grace period expired, calling on_expire callback")
+        # _last_refresh is always set by refresh() before the countdown is scheduled,
+        # so this should never be None in practice.
+        if self._last_refresh is None:
+            self._notify_finished()
+            return
+        self._expire_task = asyncio.create_task(self._run_on_expire(self._last_refresh))
+        self._expire_task.add_done_callback(self._on_expire_done)
+
+    async def _run_on_expire(self, last_refresh: datetime) -> None:
+        """Await the on_expire callback, so that it can run as a task."""
+        await self._on_expire(last_refresh)
+
+    def _on_expire_done(self, task: asyncio.Task[None]) -> None:
+        """Clear the running state once the on_expire callback has finished."""
+        if task is not self._expire_task:
+            return  # Cancelled by refresh() or stop(), which already cleaned up
+        self._expire_task = None
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            logger.error("Grace timer callback failed", exc_info=exc)
+        self._notify_finished()
+
+    def _notify_finished(self) -> None:
+        """Release anyone waiting in wait()."""
+        if self._finished is not None:
+            if not self._finished.done():
+                self._finished.set_result(None)
+            self._finished = None
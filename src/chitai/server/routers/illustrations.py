@@ -3,7 +3,7 @@
 import asyncio
 from pathlib import Path
 from typing import Annotated
-from uuid import uuid4
+from uuid import uuid7
 
 from fastapi import (
     APIRouter,
@@ -24,8 +24,9 @@ from chitai.image_processing import (
     InsufficientStorageError,
     InvalidImageError,
     fetch_image_from_url,
-    process_image,
-    save_image_file,
+    format_from_content_type,
+    process_image_with_thumbnail,
+    save_image_file_async,
 )
 from chitai.server.routers.schemas import (
     IllustrationListEntry,
@@ -85,6 +86,7 @@ async def import_illustration(
             async with asyncio.timeout(30):
                 image_data = await fetch_image_from_url(url)
             source_url = url
+            hint_format = None
         elif file:
             if file.content_type and not file.content_type.startswith("image/"):
                 detail = (
@@ -95,29 +97,29 @@ async def import_illustration(
 
             image_data = file.file.read()
             source_url = None
+            hint_format = format_from_content_type(file.content_type)
         else:
             raise HTTPException(
                 status_code=400, detail="Must provide either url or file parameter"
             )
 
-        full_image = process_image(
+        # Both variants come from a single decode of the source, off the event loop
+        full_image, thumbnail = await asyncio.to_thread(
+            process_image_with_thumbnail,
             image_data,
             settings.illustration_max_dimension,
-            settings.illustration_webp_quality,
-        )
-        thumbnail = process_image(
-            image_data,
             settings.illustration_thumbnail_max_dimension,
             settings.illustration_webp_quality,
+            hint_format=hint_format,
         )
 
-        illustration_id = str(uuid4())
+        illustration_id = str(uuid7())
         full_image_path = _get_illustration_path(illustration_id, thumbnail=False)
         thumbnail_path = _get_illustration_path(illustration_id, thumbnail=True)
 
         try:
-            save_image_file(full_image_path, full_image.data)
-            save_image_file(thumbnail_path, thumbnail.data)
+            await save_image_file_async(full_image_path, full_image.data)
+            await save_image_file_async(thumbnail_path, thumbnail.data)
             illustration = Illustration(
                 id=illustration_id,
                 source_url=source_url,
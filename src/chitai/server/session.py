@@ -1,6 +1,7 @@
 """Session state management."""
 
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 
 from chitai.language import sanitize, syllabify, tokenize
@@ -27,8 +28,9 @@ class SessionState:
     current_illustration_id : str | None
         ID of the Illustration randomly selected for current item. None when no item is
         displayed or item has no illustrations.
-    queue : list[str]
-        SessionItem IDs waiting to be displayed. Empty when no items are queued.
+    queue : deque[str]
+        SessionItem IDs waiting to be displayed, in display order. Empty when no items
+        are queued.
     words : list[str]
         Words from the current text. Empty when no text is set.
     current_word_index : int | None
@@ -41,7 +43,7 @@ class SessionState:
     language: str | None = None
     current_session_item_id: str | None = None
     current_illustration_id: str | None = None
-    queue: list[str] = field(default_factory=list)
+    queue: deque[str] = field(default_factory=deque)
     words: list[str] = field(default_factory=list)
     current_word_index: int | None = None
 
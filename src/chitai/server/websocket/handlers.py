@@ -241,7 +241,7 @@ async def next_item(session_state: SessionState, clients: set[WebSocket]) -> Non
 
     with get_session_ctx() as db_session:
         # Pop next SessionItem from queue
-        next_session_item_id = session_state.queue.pop(0)
+        next_session_item_id = session_state.queue.popleft()
         next_session_item = db_session.get(SessionItem, next_session_item_id)
 
         if not next_session_item:
@@ -0,0 +1,66 @@
+"""Pytest configuration shared by unit and integration tests."""
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from chitai.db.base import Base
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from sqlalchemy import Engine
+
+
+@pytest.fixture(scope="session")
+def template_db() -> Generator[sqlite3.Connection]:
+    """Provide an in-memory SQLite database with the schema already created.
+
+    The schema is built once per test session. Tests never use this database
+    directly; per-test fixtures copy it into a fresh database instead.
+
+    Yields
+    ------
+    sqlite3.Connection
+        Raw connection to the template database
+    """
+    connection = sqlite3.connect(":memory:", check_same_thread=False)
+    engine = create_engine(
+        "sqlite://", creator=lambda: connection, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+
+    yield connection
+
+    engine.dispose()
+
+
+@pytest.fixture
+def fresh_db(template_db: sqlite3.Connection) -> Generator[Engine]:
+    """Provide an engine bound to a fresh copy of the template database.
+
+    The copy is made with the SQLite backup API, which is cheaper than recreating the
+    schema for every test.
+
+    Parameters
+    ----------
+    template_db : sqlite3.Connection
+        Connection to the template database from template_db fixture
+
+    Yields
+    ------
+    Engine
+        Engine for a new in-memory database with the schema already created
+    """
+    connection = sqlite3.connect(":memory:", check_same_thread=False)
+    template_db.backup(connection)
+    engine = create_engine(
+        "sqlite://", creator=lambda: connection, poolclass=StaticPool
+    )
+
+    yield engine
+
+    engine.dispose()
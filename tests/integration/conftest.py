@@ -1,15 +1,17 @@
-"""Pytest configuration for integration tests."""
+"""Pytest configuration for integration tests.
+
+Every test gets its own in-memory database and a freshly reset app state. The app
+state is a per-process singleton, so tests stay isolated when pytest-xdist spreads
+them across worker processes.
+"""
 
 import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
 
-from chitai.db.base import Base
 from chitai.db.engine import configure_session_factory
 from chitai.server.app import app
 from chitai.settings import settings
@@ -17,51 +19,75 @@ from chitai.settings import settings
 if TYPE_CHECKING:
     from collections.abc import Generator
 
+    from sqlalchemy import Engine
+
 
 @pytest.fixture(autouse=True)
-def reset_app_state():
-    """Reset app state before and after each test.
+def reset_app_state(monkeypatch: pytest.MonkeyPatch):
+    """Reset app state before each test.
 
     Ensures each test starts with clean session state and stopped grace timer. Also
-    stops any running grace timers after test completes.
+    stops any running grace timer after the test completes, so it cannot fire during
+    a later test. The grace period is patched to a long default and restored on
+    teardown, even if the test fails.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Used to set the grace period without leaking it into other tests
+
     """
     # Setup: reset state to defaults
     app.state.context.session.reset()
     app.state.context.grace_timer.stop()
-    app.state.context.grace_timer.grace_period_seconds = (
-        3600  # Default grace period (tests can override)
-    )
+    monkeypatch.setattr(app.state.context.grace_timer, "grace_period_seconds", 3600)
 
     yield
 
-    # Teardown: stop timer and reset state
+    # Teardown: stop timer (session state is reset by the next test's setup)
     app.state.context.grace_timer.stop()
-    app.state.context.session.reset()
 
 
 @pytest.fixture
-def test_db():
-    """Provide in-memory test database.
+def short_grace_period(monkeypatch: pytest.MonkeyPatch) -> float:
+    """Shorten the grace period so that tests can observe it expire.
 
-    Creates a fresh SQLite in-memory database with all tables for each test. Returns a
-    sessionmaker that can be used to create database sessions.
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Used to set the grace period without leaking it into other tests
 
     Returns
     -------
-    sessionmaker[Session]
-        Session factory for creating database sessions
+    float
+        Grace period in seconds
+
     """
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
+    grace_period_seconds = 0.1
+    monkeypatch.setattr(
+        app.state.context.grace_timer, "grace_period_seconds", grace_period_seconds
     )
-    Base.metadata.create_all(engine)
-    session_factory = sessionmaker(bind=engine)
+    return grace_period_seconds
+
 
-    yield session_factory
+@pytest.fixture
+def test_db(fresh_db: Engine) -> sessionmaker[Session]:
+    """Provide in-memory test database.
 
-    engine.dispose()
+    Each test gets a fresh copy of the template database. Returns a sessionmaker that
+    can be used to create database sessions.
+
+    Parameters
+    ----------
+    fresh_db : Engine
+        Engine for a fresh database from fresh_db fixture
+
+    Returns
+    -------
+    sessionmaker[Session]
+        Session factory for creating database sessions
+    """
+    return sessionmaker(bind=fresh_db)
 
 
 @pytest.fixture
@@ -1,14 +1,21 @@
 """Helper utilities for integration tests."""
 
-from contextlib import AbstractAsyncContextManager, asynccontextmanager
+import asyncio
+import json
+from contextlib import (
+    AbstractAsyncContextManager,
+    AsyncExitStack,
+    asynccontextmanager,
+)
 from datetime import UTC, datetime
+from functools import cache
 from io import BytesIO
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from httpx import ASGITransport, AsyncClient
-from httpx_ws import aconnect_ws
-from httpx_ws.transport import ASGIWebSocketTransport
 from PIL import Image
+from sqlalchemy import select
+from starlette.websockets import WebSocketDisconnect
 
 from chitai.db.models import Illustration, Item, SessionItem
 from chitai.db.models import Session as DBSession
@@ -17,16 +24,34 @@ from chitai.server.app import app
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
-    from httpx_ws import AsyncWebSocketSession
     from sqlalchemy.orm import Session
+    from starlette.types import Message
 
 # Test constants
 FAKE_UUID = "00000000-0000-0000-0000-000000000000"
 DEFAULT_LANGUAGE = "ru"
 
+# Upper bound on waiting for a WebSocket message, so that a regression fails fast
+# instead of hanging the test (and the xdist worker running it)
+RECEIVE_TIMEOUT = 1.0
 
+
+def encode_json(data: Any) -> str:
+    """Serialize data to compact JSON, matching the framing Starlette uses."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+# Pre-serialized WebSocket messages, sent with InProcessWebSocket.send_text()
+START_SESSION = encode_json({"type": "start_session"})
+END_SESSION = encode_json({"type": "end_session"})
+NEXT_ITEM = encode_json({"type": "next_item"})
+ADVANCE_FORWARD = encode_json({"type": "advance_word", "payload": {"delta": 1}})
+ADVANCE_BACKWARD = encode_json({"type": "advance_word", "payload": {"delta": -1}})
+
+
+@cache
 def create_test_image(width: int, height: int, image_format: str = "PNG") -> bytes:
-    """Create a test image in memory.
+    """Create a test image in memory, encoding each size and format only once.
 
     Parameters
     ----------
@@ -49,62 +74,247 @@ def create_test_image(width: int, height: int, image_format: str = "PNG") -> byt
     return output.getvalue()
 
 
+class InProcessWebSocket:
+    """WebSocket client that drives the ASGI app directly through in-memory queues.
+
+    Skips the HTTP upgrade handshake and transport layers entirely: the app is invoked
+    with a synthesized ``websocket`` scope, and messages are exchanged as raw ASGI
+    events. Exposes the subset of the client API used by the tests.
+
+    Parameters
+    ----------
+    role : str
+        Client role passed to the ``/ws`` endpoint: 'controller' or 'display'
+
+    """
+
+    def __init__(self, role: str) -> None:
+        self._scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0"},
+            "scheme": "ws",
+            "server": ("test", 80),
+            "client": ("testclient", 50000),
+            "root_path": "",
+            "path": "/ws",
+            "raw_path": b"/ws",
+            "query_string": f"role={role}".encode(),
+            "headers": [],
+            "subprotocols": [],
+        }
+        self._client_to_server: asyncio.Queue[Message] = asyncio.Queue()
+        self._server_to_client: asyncio.Queue[Message] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+        # Set while the app is blocked waiting for a message that has not been sent
+        self._idle = asyncio.Event()
+
+    async def _receive(self) -> Message:
+        """ASGI receive callable that records when the app runs out of input."""
+        if self._client_to_server.empty():
+            self._idle.set()
+        message = await self._client_to_server.get()
+        self._idle.clear()
+        return message
+
+    async def connect(self) -> None:
+        """Start the app task and wait for the connection to be accepted.
+
+        Raises TimeoutError if the app does not respond or, after rejecting the
+        connection, does not return within RECEIVE_TIMEOUT seconds.
+        """
+        self._task = asyncio.create_task(
+            app(self._scope, self._receive, self._server_to_client.put)
+        )
+        await self._client_to_server.put({"type": "websocket.connect"})
+        message = await asyncio.wait_for(self._server_to_client.get(), RECEIVE_TIMEOUT)
+        if message["type"] != "websocket.accept":
+            await asyncio.wait_for(self._task, RECEIVE_TIMEOUT)
+            raise WebSocketDisconnect(message.get("code", 1000))
+
+    async def close(self) -> None:
+        """Disconnect from the app and wait for the endpoint to return.
+
+        Raises TimeoutError if the endpoint does not return within RECEIVE_TIMEOUT
+        seconds.
+        """
+        await self._client_to_server.put({"type": "websocket.disconnect", "code": 1000})
+        if self._task is not None:
+            await asyncio.wait_for(self._task, RECEIVE_TIMEOUT)
+
+    async def send_text(self, text: str) -> None:
+        """Send an already serialized message as a text message."""
+        self._idle.clear()
+        await self._client_to_server.put({"type": "websocket.receive", "text": text})
+
+    async def send_json(self, data: Any) -> None:
+        """Serialize data to JSON and send it as a text message."""
+        await self.send_text(encode_json(data))
+
+    async def receive_json(self) -> Any:
+        """Wait for the next message from the app and parse it as JSON.
+
+        Raises TimeoutError if no message arrives within RECEIVE_TIMEOUT seconds.
+        """
+        message = await asyncio.wait_for(self._server_to_client.get(), RECEIVE_TIMEOUT)
+        if message["type"] == "websocket.close":
+            raise WebSocketDisconnect(message.get("code", 1000))
+        return json.loads(message["text"])
+
+    async def wait_until_idle(self) -> None:
+        """Wait until the app has handled every message sent so far."""
+        await asyncio.wait_for(self._idle.wait(), RECEIVE_TIMEOUT)
+
+    def has_pending_messages(self) -> bool:
+        """Return whether the app has sent messages that were not received yet."""
+        return not self._server_to_client.empty()
+
+
+async def assert_no_message(ws: InProcessWebSocket) -> None:
+    """Assert that the app sent nothing in response to the messages sent so far.
+
+    Waits for the app to handle the pending input instead of for a fixed timeout, so
+    the check takes no longer than the app needs to process the messages.
+    """
+    await ws.wait_until_idle()
+    assert not ws.has_pending_messages()
+
+
+async def receive_from_all(*wss: InProcessWebSocket) -> list[Any]:
+    """Receive the next message from each client concurrently.
+
+    Returns
+    -------
+    list[Any]
+        Parsed messages, in the same order as the clients
+
+    """
+    return list(await asyncio.gather(*(ws.receive_json() for ws in wss)))
+
+
+async def send_all(ws: InProcessWebSocket, messages: list[str]) -> list[Any]:
+    """Send pre-serialized messages back-to-back and collect the replies.
+
+    The replies are awaited concurrently with the sends rather than one round trip
+    per message. Each message must produce exactly one state broadcast.
+
+    Parameters
+    ----------
+    ws : InProcessWebSocket
+        WebSocket session to send through and receive from
+    messages : list[str]
+        Pre-serialized messages to send, in order
+
+    Returns
+    -------
+    list[Any]
+        Parsed replies, in the same order as messages
+
+    """
+    replies = asyncio.gather(*(ws.receive_json() for _ in messages))
+    for message in messages:
+        await ws.send_text(message)
+    return list(await replies)
+
+
+async def _open_ws(
+    role: str, *, skip_initial_state: bool = False
+) -> InProcessWebSocket:
+    """Open a WebSocket client with the given role, closing it again on failure."""
+    ws = InProcessWebSocket(role)
+    try:
+        await ws.connect()
+        if skip_initial_state:
+            await ws.receive_json()
+    except BaseException:
+        await ws.close()
+        raise
+    return ws
+
+
 @asynccontextmanager
-async def _connect_ws(role: str) -> AsyncGenerator[AsyncWebSocketSession]:
+async def _connect_ws(
+    role: str, *, skip_initial_state: bool = False
+) -> AsyncGenerator[InProcessWebSocket]:
     """Connect a WebSocket client with the given role."""
-    async with (
-        ASGIWebSocketTransport(app=app) as transport,
-        AsyncClient(transport=transport, base_url="http://test") as client,
-        aconnect_ws(f"http://test/ws?role={role}", client) as ws,
-    ):
+    ws = await _open_ws(role, skip_initial_state=skip_initial_state)
+    try:
         yield ws
+    finally:
+        await ws.close()
+
+
+def connect_controller(
+    *, skip_initial_state: bool = False
+) -> AbstractAsyncContextManager[InProcessWebSocket]:
+    """Return async context manager for a controller WebSocket connection.
+
+    Parameters
+    ----------
+    skip_initial_state : bool
+        Consume the state message sent on connect before handing out the client
+
+    """
+    return _connect_ws("controller", skip_initial_state=skip_initial_state)
 
 
-def connect_controller() -> AbstractAsyncContextManager[AsyncWebSocketSession]:
-    """Return async context manager for a controller WebSocket connection."""
-    return _connect_ws("controller")
+def connect_display(
+    *, skip_initial_state: bool = False
+) -> AbstractAsyncContextManager[InProcessWebSocket]:
+    """Return async context manager for a display WebSocket connection.
 
+    Parameters
+    ----------
+    skip_initial_state : bool
+        Consume the state message sent on connect before handing out the client
 
-def connect_display() -> AbstractAsyncContextManager[AsyncWebSocketSession]:
-    """Return async context manager for a display WebSocket connection."""
-    return _connect_ws("display")
+    """
+    return _connect_ws("display", skip_initial_state=skip_initial_state)
 
 
 @asynccontextmanager
-async def connect_clients() -> AsyncGenerator[
-    tuple[AsyncWebSocketSession, AsyncWebSocketSession]
-]:
-    """Connect both controller and display WebSocket clients sharing a transport.
+async def connect_clients(
+    *, skip_initial_state: bool = False
+) -> AsyncGenerator[tuple[InProcessWebSocket, InProcessWebSocket]]:
+    """Connect both controller and display WebSocket clients.
+
+    Returns (controller_ws, display_ws) tuple. Both handshakes run concurrently.
+
+    Parameters
+    ----------
+    skip_initial_state : bool
+        Consume the state messages sent on connect before handing out the clients
 
-    Returns (controller_ws, display_ws) tuple.
     """
-    async with (
-        ASGIWebSocketTransport(app=app) as transport,
-        AsyncClient(transport=transport, base_url="http://test") as client,
-        aconnect_ws("http://test/ws?role=controller", client) as controller_ws,
-        aconnect_ws("http://test/ws?role=display", client) as display_ws,
-    ):
+    controller_ws, display_ws = await asyncio.gather(
+        _open_ws("controller", skip_initial_state=skip_initial_state),
+        _open_ws("display", skip_initial_state=skip_initial_state),
+        return_exceptions=True,
+    )
+    async with AsyncExitStack() as stack:
+        # Register every client that did connect before raising, so none is leaked
+        for ws in (controller_ws, display_ws):
+            if isinstance(ws, InProcessWebSocket):
+                stack.push_async_callback(ws.close)
+        if isinstance(controller_ws, BaseException):
+            raise controller_ws
+        if isinstance(display_ws, BaseException):
+            raise display_ws
         yield controller_ws, display_ws
 
 
 @asynccontextmanager
 async def started_session() -> AsyncGenerator[
-    tuple[AsyncWebSocketSession, AsyncWebSocketSession, str]
+    tuple[InProcessWebSocket, InProcessWebSocket, str]
 ]:
     """Connect controller and display, start a session.
 
     Returns (controller_ws, display_ws, session_id) tuple. Use this when the test needs
     an active session but starting the session is not what's being tested.
     """
-    async with connect_clients() as (controller_ws, display_ws):
-        # Consume initial state messages
-        await controller_ws.receive_json()
-        await display_ws.receive_json()
-
+    async with connect_clients(skip_initial_state=True) as (controller_ws, display_ws):
         # Start session
-        await controller_ws.send_json({"type": "start_session"})
-        controller_data = await controller_ws.receive_json()
-        await display_ws.receive_json()
+        await controller_ws.send_text(START_SESSION)
+        controller_data, _ = await receive_from_all(controller_ws, display_ws)
         session_id = controller_data["payload"]["session_id"]
         yield controller_ws, display_ws, session_id
 
@@ -119,10 +329,9 @@ async def http_client() -> AsyncGenerator[AsyncClient]:
         HTTP client configured to communicate with the FastAPI app
 
     """
-    async with (
-        ASGIWebSocketTransport(app=app) as transport,
-        AsyncClient(transport=transport, base_url="http://test") as client,
-    ):
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
         yield client
 
 
@@ -209,6 +418,50 @@ def create_session_item(
     return session_item
 
 
+def get_items_by_text(db_session: Session, texts: list[str]) -> dict[str, Item]:
+    """Load several items by text in a single query.
+
+    Parameters
+    ----------
+    db_session : Session
+        Database session to use
+    texts : list[str]
+        Item texts to look up
+
+    Returns
+    -------
+    dict[str, Item]
+        Items keyed by text; texts without a matching item are absent
+
+    """
+    items = db_session.scalars(select(Item).where(Item.text.in_(texts))).all()
+    return {item.text: item for item in items}
+
+
+def get_session_items_by_item_id(
+    db_session: Session, session_id: str
+) -> dict[str, SessionItem]:
+    """Load all session items of a session in a single query.
+
+    Parameters
+    ----------
+    db_session : Session
+        Database session to use
+    session_id : str
+        ID of the session whose items to load
+
+    Returns
+    -------
+    dict[str, SessionItem]
+        Session items keyed by item ID
+
+    """
+    session_items = db_session.scalars(
+        select(SessionItem).where(SessionItem.session_id == session_id)
+    ).all()
+    return {session_item.item_id: session_item for session_item in session_items}
+
+
 def create_illustration(
     db_session: Session,
     *,
@@ -249,8 +502,20 @@ def create_illustration(
     return illustration
 
 
+async def _get_or_create_item_id(
+    client: AsyncClient, text: str, language: str = DEFAULT_LANGUAGE
+) -> str:
+    """Create or get an item via REST API and return its ID."""
+    response = await client.post(
+        "/api/items",
+        data={"text": text, "language": language},
+    )
+    response.raise_for_status()
+    return response.json()["id"]
+
+
 async def send_add_item(
-    ws: AsyncWebSocketSession, text: str, language: str = DEFAULT_LANGUAGE
+    ws: InProcessWebSocket, text: str, language: str = DEFAULT_LANGUAGE
 ) -> None:
     """Send add_item message via WebSocket using the two-step flow.
 
@@ -259,7 +524,7 @@ async def send_add_item(
 
     Parameters
     ----------
-    ws : AsyncWebSocketSession
+    ws : InProcessWebSocket
         WebSocket session to send through
     text : str
         Item text to add
@@ -268,17 +533,43 @@ async def send_add_item(
 
     """
     # Create or get item via REST API
-    async with (
-        ASGITransport(app=app) as transport,
-        AsyncClient(transport=transport, base_url="http://test") as client,
-    ):
-        response = await client.post(
-            "/api/items",
-            data={"text": text, "language": language},
-        )
-        response.raise_for_status()
-        item_data = response.json()
-        item_id = item_data["id"]
+    async with http_client() as client:
+        item_id = await _get_or_create_item_id(client, text, language)
 
     # Send WebSocket message
     await ws.send_json({"type": "add_item", "payload": {"item_id": item_id}})
+
+
+async def add_items(
+    ws: InProcessWebSocket, texts: list[str], language: str = DEFAULT_LANGUAGE
+) -> list[dict]:
+    """Add several items to the session and collect the resulting state broadcasts.
+
+    All items are resolved via REST API first, then the add_item messages are sent
+    back-to-back and the state broadcasts are awaited concurrently, instead of paying
+    one full round trip per item.
+
+    Parameters
+    ----------
+    ws : InProcessWebSocket
+        WebSocket session to send through and receive from
+    texts : list[str]
+        Item texts to add, in order
+    language : str
+        Item language (defaults to DEFAULT_LANGUAGE)
+
+    Returns
+    -------
+    list[dict]
+        State messages received after each add_item, in the same order as texts
+
+    """
+    async with http_client() as client:
+        item_ids = [
+            await _get_or_create_item_id(client, text, language) for text in texts
+        ]
+
+    for item_id in item_ids:
+        await ws.send_json({"type": "add_item", "payload": {"item_id": item_id}})
+
+    return list(await asyncio.gather(*(ws.receive_json() for _ in texts)))
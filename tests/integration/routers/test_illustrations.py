@@ -4,7 +4,6 @@ from io import BytesIO
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
-import pytest
 from PIL import Image
 
 from chitai.db.models import ItemIllustration
@@ -26,7 +25,6 @@ if TYPE_CHECKING:
 class TestIllustrationsEndpoints:
     """Tests for /api/illustrations endpoints."""
 
-    @pytest.mark.asyncio
     async def test_list_illustrations_empty(self):
         """Test GET /api/illustrations returns empty list."""
         async with http_client() as client:
@@ -37,7 +35,6 @@ class TestIllustrationsEndpoints:
             assert data["illustrations"] == []
             assert data["total"] == 0
 
-    @pytest.mark.asyncio
     async def test_list_illustrations_with_data(self, db_session: Session):
         """Test GET /api/illustrations returns all illustrations with item counts."""
         illustration1 = create_illustration(
@@ -78,7 +75,6 @@ class TestIllustrationsEndpoints:
             assert illustrations_by_id[str(illustration2.id)]["item_count"] == 0
             assert illustrations_by_id[str(illustration2.id)]["source_url"] is None
 
-    @pytest.mark.asyncio
     async def test_list_illustrations_pagination(self, db_session: Session):
         """Test GET /api/illustrations respects pagination parameters."""
         for _ in range(5):
@@ -99,7 +95,6 @@ class TestIllustrationsEndpoints:
             assert len(data["illustrations"]) == 2
             assert data["total"] == 5
 
-    @pytest.mark.asyncio
     async def test_get_illustration_by_id(self, db_session: Session):
         """Test GET /api/illustrations/{id} returns single illustration."""
         illustration = create_illustration(
@@ -116,7 +111,6 @@ class TestIllustrationsEndpoints:
             assert data["width"] == 1200
             assert data["item_count"] == 0
 
-    @pytest.mark.asyncio
     async def test_get_illustration_not_found(self):
         """Test GET /api/illustrations/{id} returns 404 when not found."""
         async with http_client() as client:
@@ -125,7 +119,6 @@ class TestIllustrationsEndpoints:
             assert response.status_code == 404
             assert response.json()["detail"] == "Illustration not found"
 
-    @pytest.mark.asyncio
     async def test_delete_illustration(self, db_session: Session):
         """Test DELETE /api/illustrations/{id} deletes illustration."""
         illustration = create_illustration(db_session)
@@ -140,7 +133,6 @@ class TestIllustrationsEndpoints:
             response = await client.get(f"/api/illustrations/{illustration.id}")
             assert response.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_delete_illustration_not_found(self):
         """Test DELETE /api/illustrations/{id} returns 404 when not found."""
         async with http_client() as client:
@@ -149,7 +141,6 @@ class TestIllustrationsEndpoints:
             assert response.status_code == 404
             assert response.json()["detail"] == "Illustration not found"
 
-    @pytest.mark.asyncio
     async def test_delete_illustration_cascades_to_item_illustrations(
         self, db_session: Session
     ):
@@ -182,7 +173,6 @@ class TestIllustrationsEndpoints:
             response = await client.get(f"/api/items/{item.id}")
             assert response.status_code == 200
 
-    @pytest.mark.asyncio
     async def test_import_illustration_from_url(self, temp_illustration_dir: Path):
         """Test POST /api/illustrations with URL parameter."""
         test_image = create_test_image(800, 600, "PNG")
@@ -218,7 +208,6 @@ class TestIllustrationsEndpoints:
                 assert full_image_path.stat().st_size > 0
                 assert thumbnail_path.stat().st_size > 0
 
-    @pytest.mark.asyncio
     async def test_import_illustration_from_file(self, temp_illustration_dir: Path):
         """Test POST /api/illustrations with file upload."""
         test_image = create_test_image(1024, 768, "JPEG")
@@ -245,7 +234,6 @@ class TestIllustrationsEndpoints:
             assert full_image_path.stat().st_size > 0
             assert thumbnail_path.stat().st_size > 0
 
-    @pytest.mark.asyncio
     async def test_import_illustration_both_params_error(self):
         """Test POST /api/illustrations rejects both url and file."""
         test_image = create_test_image(800, 600)
@@ -260,7 +248,6 @@ class TestIllustrationsEndpoints:
             assert response.status_code == 400
             assert "Cannot provide both" in response.json()["detail"]
 
-    @pytest.mark.asyncio
     async def test_import_illustration_neither_param_error(self):
         """Test POST /api/illustrations rejects neither url nor file."""
         async with http_client() as client:
@@ -269,7 +256,6 @@ class TestIllustrationsEndpoints:
             assert response.status_code == 400
             assert "Must provide either" in response.json()["detail"]
 
-    @pytest.mark.asyncio
     async def test_import_illustration_invalid_file_type(self):
         """Test POST /api/illustrations rejects non-image files."""
         async with http_client() as client:
@@ -281,7 +267,6 @@ class TestIllustrationsEndpoints:
             assert response.status_code == 400
             assert "Invalid content type" in response.json()["detail"]
 
-    @pytest.mark.asyncio
     async def test_import_illustration_invalid_image_data(self):
         """Test POST /api/illustrations handles invalid image data."""
 
@@ -301,7 +286,6 @@ class TestIllustrationsEndpoints:
                 assert response.status_code == 400
                 assert "detail" in response.json()
 
-    @pytest.mark.asyncio
     async def test_import_illustration_download_error(self):
         """Test POST /api/illustrations handles download errors."""
 
@@ -322,7 +306,6 @@ class TestIllustrationsEndpoints:
                 assert response.status_code == 400
                 assert "Failed to download" in response.json()["detail"]
 
-    @pytest.mark.asyncio
     async def test_import_illustration_timeout(self):
         """Test POST /api/illustrations handles timeout."""
 
@@ -343,7 +326,6 @@ class TestIllustrationsEndpoints:
                 assert response.status_code == 400
                 assert "timed out" in response.json()["detail"]
 
-    @pytest.mark.asyncio
     async def test_import_illustration_insufficient_storage(self):
         """Test POST /api/illustrations returns 507 when disk is full.
 
@@ -359,7 +341,7 @@ class TestIllustrationsEndpoints:
                 side_effect=mock_fetch,
             ),
             patch(
-                "chitai.server.routers.illustrations.save_image_file",
+                "chitai.server.routers.illustrations.save_image_file_async",
                 side_effect=InsufficientStorageError(storage_msg),
             ),
         ):
@@ -372,7 +354,6 @@ class TestIllustrationsEndpoints:
                 assert response.status_code == 507
                 assert "disk space" in response.json()["detail"]
 
-    @pytest.mark.asyncio
     async def test_import_illustration_resizes_large_images(
         self,
         temp_illustration_dir: Path,
@@ -414,7 +395,6 @@ class TestIllustrationsEndpoints:
                     # Thumbnail should be even smaller (max 200px)
                     assert max(img.size) == 200
 
-    @pytest.mark.asyncio
     async def test_get_illustration_image(
         self, db_session: Session, temp_illustration_dir: Path
     ):
@@ -436,7 +416,6 @@ class TestIllustrationsEndpoints:
             assert "max-age=31536000" in response.headers["Cache-Control"]
             assert len(response.content) > 0
 
-    @pytest.mark.asyncio
     async def test_get_illustration_thumbnail(
         self, db_session: Session, temp_illustration_dir: Path
     ):
@@ -459,7 +438,6 @@ class TestIllustrationsEndpoints:
             assert "Cache-Control" in response.headers
             assert len(response.content) > 0
 
-    @pytest.mark.asyncio
     async def test_get_illustration_image_not_found(self):
         """Test GET /api/illustrations/{id}/image returns 404."""
         async with http_client() as client:
@@ -468,7 +446,6 @@ class TestIllustrationsEndpoints:
             assert response.status_code == 404
             assert response.json()["detail"] == "Illustration not found"
 
-    @pytest.mark.asyncio
     async def test_get_illustration_image_file_missing(self, db_session: Session):
         """Test GET /api/illustrations/{id}/image returns 404 when file is missing."""
         illustration = create_illustration(db_session)
@@ -479,7 +456,6 @@ class TestIllustrationsEndpoints:
             assert response.status_code == 404
             assert "file not found" in response.json()["detail"]
 
-    @pytest.mark.asyncio
     async def test_get_illustration_thumbnail_file_missing(self, db_session: Session):
         """Test GET /api/illustrations/{id}/thumbnail returns 404."""
         illustration = create_illustration(db_session)
@@ -496,7 +472,6 @@ class TestIllustrationsEndpoints:
 class TestItemIllustrationLinking:
     """Tests for /api/items/{id}/illustrations endpoints."""
 
-    @pytest.mark.asyncio
     async def test_list_item_illustrations_empty(self, db_session: Session):
         """Test GET /api/items/{id}/illustrations returns empty list."""
         item = create_item(db_session, "собака")
@@ -507,7 +482,6 @@ class TestItemIllustrationLinking:
             assert response.status_code == 200
             assert response.json() == []
 
-    @pytest.mark.asyncio
     async def test_list_item_illustrations_not_found(self):
         """Test GET /api/items/{id}/illustrations returns 404 for non-existent item."""
         async with http_client() as client:
@@ -516,7 +490,6 @@ class TestItemIllustrationLinking:
             assert response.status_code == 404
             assert response.json()["detail"] == "Item not found"
 
-    @pytest.mark.asyncio
     async def test_link_illustration_to_item(self, db_session: Session):
         """Test POST /api/items/{id}/illustrations/{illustration_id} links."""
         item = create_item(db_session, "собака")
@@ -537,7 +510,6 @@ class TestItemIllustrationLinking:
             assert len(data) == 1
             assert data[0]["id"] == str(illustration.id)
 
-    @pytest.mark.asyncio
     async def test_link_illustration_duplicate_returns_409(self, db_session: Session):
         """Test linking same illustration twice returns 409 conflict."""
         item = create_item(db_session, "собака")
@@ -558,7 +530,6 @@ class TestItemIllustrationLinking:
             assert response.status_code == 409
             assert response.json()["detail"] == "Link already exists"
 
-    @pytest.mark.asyncio
     async def test_link_illustration_item_not_found(self, db_session: Session):
         """Test linking to non-existent item returns 404."""
         illustration = create_illustration(db_session)
@@ -571,7 +542,6 @@ class TestItemIllustrationLinking:
             assert response.status_code == 404
             assert response.json()["detail"] == "Item not found"
 
-    @pytest.mark.asyncio
     async def test_link_illustration_illustration_not_found(self, db_session: Session):
         """Test linking non-existent illustration returns 404."""
         item = create_item(db_session, "собака")
@@ -584,7 +554,6 @@ class TestItemIllustrationLinking:
             assert response.status_code == 404
             assert response.json()["detail"] == "Illustration not found"
 
-    @pytest.mark.asyncio
     async def test_unlink_illustration_from_item(self, db_session: Session):
         """Test DELETE /api/items/{id}/illustrations/{illustration_id} unlinks."""
         item = create_item(db_session, "собака")
@@ -609,7 +578,6 @@ class TestItemIllustrationLinking:
             assert response.status_code == 200
             assert response.json() == []
 
-    @pytest.mark.asyncio
     async def test_unlink_illustration_link_not_found(self, db_session: Session):
         """Test unlinking non-existent link returns 404."""
         item = create_item(db_session, "собака")
@@ -623,7 +591,6 @@ class TestItemIllustrationLinking:
             assert response.status_code == 404
             assert response.json()["detail"] == "Link not found"
 
-    @pytest.mark.asyncio
     async def test_list_multiple_illustrations_for_item(self, db_session: Session):
         """Test listing multiple illustrations linked to an item."""
         item = create_item(db_session, "собака")
@@ -3,8 +3,6 @@
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
-import pytest
-
 from chitai.db.models import Item, ItemIllustration
 from tests.integration.helpers import (
     DEFAULT_LANGUAGE,
@@ -23,7 +21,6 @@ if TYPE_CHECKING:
 class TestItemsEndpoints:
     """Tests for /api/items endpoints."""
 
-    @pytest.mark.asyncio
     async def test_list_items_empty(self):
         """Test GET /api/items returns empty list when no items exist."""
         async with http_client() as client:
@@ -33,7 +30,6 @@ class TestItemsEndpoints:
             data = response.json()
             assert data["items"] == []
 
-    @pytest.mark.asyncio
     async def test_list_items_with_data(self, db_session: Session):
         """Test GET /api/items returns all items with usage stats."""
         # Create test items
@@ -69,7 +65,6 @@ class TestItemsEndpoints:
             assert items_by_text["вода"]["usage_count"] == 0
             assert items_by_text["вода"]["last_used_at"] is None
 
-    @pytest.mark.asyncio
     async def test_create_item(self):
         """Test POST /api/items creates a new item."""
         async with http_client() as client:
@@ -85,7 +80,6 @@ class TestItemsEndpoints:
             assert "id" in data
             assert "created_at" in data
 
-    @pytest.mark.asyncio
     async def test_create_item_different_languages(self):
         """Test creating items with different languages."""
         async with http_client() as client:
@@ -104,7 +98,6 @@ class TestItemsEndpoints:
             items = response.json()["items"]
             assert len(items) == 3
 
-    @pytest.mark.asyncio
     async def test_create_item_duplicate(self):
         """Test POST /api/items is idempotent - returns existing item with 200."""
         async with http_client() as client:
@@ -129,7 +122,6 @@ class TestItemsEndpoints:
             assert second_item["text"] == "дубликат"
             assert second_item["language"] == "ru"
 
-    @pytest.mark.asyncio
     async def test_create_item_empty_text(self):
         """Test POST /api/items returns 422 for empty text."""
         async with http_client() as client:
@@ -140,7 +132,6 @@ class TestItemsEndpoints:
             # FastAPI returns 422 for empty required field
             assert response.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_create_item_whitespace_only(self):
         """Test POST /api/items returns 400 for whitespace-only text."""
         async with http_client() as client:
@@ -151,7 +142,6 @@ class TestItemsEndpoints:
             assert response.status_code == 400
             assert "cannot be empty" in response.json()["detail"]
 
-    @pytest.mark.asyncio
     async def test_create_item_trims_whitespace(self):
         """Test POST /api/items trims leading/trailing whitespace."""
         async with http_client() as client:
@@ -162,7 +152,6 @@ class TestItemsEndpoints:
             assert response.status_code == 201
             assert response.json()["text"] == "текст"
 
-    @pytest.mark.asyncio
     async def test_create_item_invalid_language(self):
         """Test POST /api/items returns 422 for invalid language."""
         async with http_client() as client:
@@ -172,7 +161,6 @@ class TestItemsEndpoints:
             )
             assert response.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_get_item_by_id(self, db_session: Session):
         """Test GET /api/items/{id} returns single item with correct stats."""
         item = create_item(db_session, "тестовый")
@@ -190,7 +178,6 @@ class TestItemsEndpoints:
             assert data["usage_count"] == 1
             assert data["last_used_at"] is not None
 
-    @pytest.mark.asyncio
     async def test_get_item_not_found(self):
         """Test GET /api/items/{id} returns 404 for non-existent item."""
         async with http_client() as client:
@@ -199,7 +186,6 @@ class TestItemsEndpoints:
             assert response.status_code == 404
             assert response.json()["detail"] == "Item not found"
 
-    @pytest.mark.asyncio
     async def test_usage_count_increments_correctly(self, db_session: Session):
         """Test usage_count increments correctly with multiple session items."""
         item = create_item(db_session, "повторяющийся")
@@ -218,7 +204,6 @@ class TestItemsEndpoints:
             data = response.json()
             assert data["usage_count"] == 6
 
-    @pytest.mark.asyncio
     async def test_last_used_at_reflects_most_recent_usage(self, db_session: Session):
         """Test last_used_at reflects most recent usage."""
         item = create_item(db_session, "временной")
@@ -239,7 +224,6 @@ class TestItemsEndpoints:
             # SQLite stores without timezone
             assert data["last_used_at"] == "2025-01-02T15:30:00"
 
-    @pytest.mark.asyncio
     async def test_delete_item(self, db_session: Session):
         """Test DELETE /api/items/{id} deletes item."""
         item = create_item(db_session, "удалить")
@@ -254,7 +238,6 @@ class TestItemsEndpoints:
             response = await client.get(f"/api/items/{item.id}")
             assert response.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_delete_item_not_found(self):
         """Test DELETE /api/items/{id} returns 404 for non-existent item."""
         async with http_client() as client:
@@ -263,7 +246,6 @@ class TestItemsEndpoints:
             assert response.status_code == 404
             assert response.json()["detail"] == "Item not found"
 
-    @pytest.mark.asyncio
     async def test_delete_item_cascades_to_session_items(self, db_session: Session):
         """Test deleting an item also deletes its session items."""
         item = create_item(db_session, "каскад")
@@ -285,7 +267,6 @@ class TestItemsEndpoints:
             assert response.status_code == 200
             assert len(response.json()["items"]) == 0
 
-    @pytest.mark.asyncio
     async def test_list_items_includes_illustration_count(self, db_session: Session):
         """Test GET /api/items returns illustration_count for each item."""
         # Create items
@@ -314,7 +295,6 @@ class TestItemsEndpoints:
             assert items_by_text["с картинками"]["illustration_count"] == 2  # noqa: RUF001
             assert items_by_text["без картинок"]["illustration_count"] == 0
 
-    @pytest.mark.asyncio
     async def test_get_item_includes_illustration_count(self, db_session: Session):
         """Test GET /api/items/{id} returns illustration_count."""
         item = create_item(db_session, "тестовый")
@@ -338,7 +318,6 @@ class TestItemsEndpoints:
 class TestItemsAutocompleteEndpoint:
     """Tests for /api/items/autocomplete endpoint."""
 
-    @pytest.mark.asyncio
     async def test_autocomplete_basic_match(self, db_session: Session):
         """Test autocomplete returns matching items."""
         # Create items with similar prefixes
@@ -360,7 +339,6 @@ class TestItemsAutocompleteEndpoint:
             texts = [item["text"] for item in data["suggestions"]]
             assert texts == ["черепаха", "черепаховый", "черешня"]
 
-    @pytest.mark.asyncio
     async def test_autocomplete_respects_limit(self, db_session: Session):
         """Test autocomplete respects limit parameter."""
         create_item(db_session, "тест1")  # noqa: RUF001
@@ -378,7 +356,6 @@ class TestItemsAutocompleteEndpoint:
             data = response.json()
             assert len(data["suggestions"]) == 2
 
-    @pytest.mark.asyncio
     async def test_autocomplete_respects_large_limit(self, db_session: Session):
         """Test autocomplete respects large limit values."""
         # Create 15 items
@@ -396,7 +373,6 @@ class TestItemsAutocompleteEndpoint:
             # Should return all 15 items since we asked for 20
             assert len(data["suggestions"]) == 15
 
-    @pytest.mark.asyncio
     async def test_autocomplete_filters_by_language(self, db_session: Session):
         """Test autocomplete filters by language."""
         # Create Russian item
@@ -428,7 +404,6 @@ class TestItemsAutocompleteEndpoint:
             assert len(data["suggestions"]) == 1
             assert data["suggestions"][0]["text"] == "черныйхлеб"
 
-    @pytest.mark.asyncio
     async def test_autocomplete_case_sensitive(self, db_session: Session):
         """Test autocomplete is case-sensitive."""
         create_item(db_session, "Тест")
@@ -454,7 +429,6 @@ class TestItemsAutocompleteEndpoint:
             assert len(data["suggestions"]) == 1
             assert data["suggestions"][0]["text"] == "Тест"
 
-    @pytest.mark.asyncio
     async def test_autocomplete_no_matches(self, db_session: Session):
         """Test autocomplete returns empty list when no matches."""
         create_item(db_session, "молоко")
@@ -468,7 +442,6 @@ class TestItemsAutocompleteEndpoint:
             data = response.json()
             assert data["suggestions"] == []
 
-    @pytest.mark.asyncio
     async def test_autocomplete_returns_minimal_fields(self, db_session: Session):
         """Test autocomplete only returns id and text, not usage stats."""
         item = create_item(db_session, "проверка")
@@ -494,7 +467,6 @@ class TestItemsAutocompleteEndpoint:
 class TestItemsSearchEndpoint:
     """Tests for /api/items/search endpoint."""
 
-    @pytest.mark.asyncio
     async def test_search_basic_substring_match(self, db_session: Session):
         """Test search returns items matching substring anywhere in text."""
         create_item(db_session, "картофель")
@@ -516,7 +488,6 @@ class TestItemsSearchEndpoint:
             texts = [item["text"] for item in data["items"]]
             assert texts == ["картофель", "каша", "молочная каша"]
 
-    @pytest.mark.asyncio
     async def test_search_empty_query_returns_all(self, db_session: Session):
         """Test search with no query string returns all items for language."""
         create_item(db_session, "один")
@@ -534,7 +505,6 @@ class TestItemsSearchEndpoint:
             assert len(data["items"]) == 3
             assert data["has_more"] is False
 
-    @pytest.mark.asyncio
     async def test_search_filters_by_language(self, db_session: Session):
         """Test search only returns items matching the language parameter."""
         # Create items in different languages
@@ -566,7 +536,6 @@ class TestItemsSearchEndpoint:
             assert len(data["items"]) == 1
             assert data["items"][0]["language"] == "de"
 
-    @pytest.mark.asyncio
     async def test_search_sorted_alphabetically(self, db_session: Session):
         """Test search results are sorted alphabetically by text."""
         create_item(db_session, "яблоко")
@@ -585,7 +554,6 @@ class TestItemsSearchEndpoint:
             texts = [item["text"] for item in data["items"]]
             assert texts == ["арбуз", "банан", "груша", "яблоко"]
 
-    @pytest.mark.asyncio
     async def test_search_filter_new_items(self, db_session: Session):
         """Test 'new' filter returns only items never used in any session."""
         # Create items
@@ -613,7 +581,6 @@ class TestItemsSearchEndpoint:
             for item in data["items"]:
                 assert item["is_new"] is True
 
-    @pytest.mark.asyncio
     async def test_search_filter_illustrated_items(self, db_session: Session):
         """Test 'illustrated' filter returns only items with illustrations."""
         # Create items
@@ -646,7 +613,6 @@ class TestItemsSearchEndpoint:
             for item in data["items"]:
                 assert item["has_illustrations"] is True
 
-    @pytest.mark.asyncio
     async def test_search_filter_exclude_session(self, db_session: Session):
         """Test exclude_session filter removes items from specified session."""
         # Create items
@@ -670,7 +636,6 @@ class TestItemsSearchEndpoint:
             assert len(data["items"]) == 1
             assert data["items"][0]["text"] == "третий"
 
-    @pytest.mark.asyncio
     async def test_search_exclude_session_includes_queued_items(
         self, db_session: Session
     ):
@@ -706,7 +671,6 @@ class TestItemsSearchEndpoint:
             assert len(data["items"]) == 1
             assert data["items"][0]["text"] == "не использован"
 
-    @pytest.mark.asyncio
     async def test_search_combined_filters(self, db_session: Session):
         """Test combining multiple filters with AND logic."""
         # Create various items
@@ -750,7 +714,6 @@ class TestItemsSearchEndpoint:
             assert data["items"][0]["is_new"] is True
             assert data["items"][0]["has_illustrations"] is True
 
-    @pytest.mark.asyncio
     async def test_search_has_more_flag_when_truncated(self, db_session: Session):
         """Test has_more flag is True when results exceed limit."""
         # Create 10 items
@@ -769,7 +732,6 @@ class TestItemsSearchEndpoint:
             assert len(data["items"]) == 5
             assert data["has_more"] is True
 
-    @pytest.mark.asyncio
     async def test_search_has_more_flag_when_not_truncated(self, db_session: Session):
         """Test has_more flag is False when all results fit within limit."""
         # Create 5 items
@@ -788,7 +750,6 @@ class TestItemsSearchEndpoint:
             assert len(data["items"]) == 5
             assert data["has_more"] is False
 
-    @pytest.mark.asyncio
     async def test_search_has_more_flag_exact_limit(self, db_session: Session):
         """Test has_more flag is False when results exactly match limit."""
         # Create exactly 5 items
@@ -806,7 +767,6 @@ class TestItemsSearchEndpoint:
             assert len(data["items"]) == 5
             assert data["has_more"] is False
 
-    @pytest.mark.asyncio
     async def test_search_no_matches_returns_empty(self, db_session: Session):
         """Test search with no matches returns empty list."""
         create_item(db_session, "молоко")
@@ -823,7 +783,6 @@ class TestItemsSearchEndpoint:
             assert data["items"] == []
             assert data["has_more"] is False
 
-    @pytest.mark.asyncio
     async def test_search_is_new_flag_correct(self, db_session: Session):
         """Test is_new flag accurately reflects usage status."""
         create_item(db_session, "новый")
@@ -845,7 +804,6 @@ class TestItemsSearchEndpoint:
             assert items_by_text["новый"]["is_new"] is True
             assert items_by_text["использованный"]["is_new"] is False
 
-    @pytest.mark.asyncio
     async def test_search_has_illustrations_flag_correct(self, db_session: Session):
         """Test has_illustrations flag accurately reflects illustration status."""
         illustrated_item = create_item(db_session, "с картинкой")  # noqa: RUF001
@@ -870,7 +828,6 @@ class TestItemsSearchEndpoint:
             assert items_by_text["с картинкой"]["has_illustrations"] is True  # noqa: RUF001
             assert items_by_text["без картинки"]["has_illustrations"] is False
 
-    @pytest.mark.asyncio
     async def test_search_flags_correct_with_both_session_items_and_illustrations(
         self, db_session: Session
     ):
@@ -908,7 +865,6 @@ class TestItemsSearchEndpoint:
             assert result["is_new"] is False
             assert result["has_illustrations"] is True
 
-    @pytest.mark.asyncio
     async def test_search_case_sensitive(self, db_session: Session):
         """Test search is case-sensitive."""
         create_item(db_session, "Тест")
@@ -935,7 +891,6 @@ class TestItemsSearchEndpoint:
             assert len(data["items"]) == 1
             assert data["items"][0]["text"] == "Тест"
 
-    @pytest.mark.asyncio
     async def test_search_response_fields(self, db_session: Session):
         """Test search response contains all expected fields."""
         item = create_item(db_session, "проверка полей")
@@ -967,7 +922,6 @@ class TestItemsSearchEndpoint:
             assert isinstance(result_item["is_new"], bool)
             assert isinstance(result_item["has_illustrations"], bool)
 
-    @pytest.mark.asyncio
     async def test_search_rejects_limit_above_maximum(self):
         """Test search returns 422 when limit exceeds the allowed maximum."""
         async with http_client() as client:
@@ -978,7 +932,6 @@ class TestItemsSearchEndpoint:
 
             assert response.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_search_filter_starred_items(self, db_session: Session):
         """Test 'starred' filter returns only starred items."""
         starred_item = create_item(db_session, "звезда")
@@ -998,7 +951,6 @@ class TestItemsSearchEndpoint:
             assert data["items"][0]["text"] == "звезда"
             assert data["items"][0]["starred"] is True
 
-    @pytest.mark.asyncio
     async def test_search_starred_flag_in_results(self, db_session: Session):
         """Test starred flag is correctly set on search results."""
         starred_item = create_item(db_session, "отмечен")
@@ -1022,7 +974,6 @@ class TestItemsSearchEndpoint:
 class TestItemsStarEndpoint:
     """Tests for PUT/DELETE /api/items/{id}/star endpoints."""
 
-    @pytest.mark.asyncio
     async def test_star_item(self, db_session: Session):
         """Test PUT stars an item."""
         item = create_item(db_session, "тест")
@@ -1032,10 +983,9 @@ class TestItemsStarEndpoint:
 
             assert response.status_code == 204
 
-        db_session.refresh(item)
+        db_session.refresh(item, ["starred"])
         assert item.starred is True
 
-    @pytest.mark.asyncio
     async def test_star_item_is_idempotent(self, db_session: Session):
         """Test PUT /star on an already-starred item is a no-op."""
         item = create_item(db_session, "тест")
@@ -1047,10 +997,9 @@ class TestItemsStarEndpoint:
 
             assert response.status_code == 204
 
-        db_session.refresh(item)
+        db_session.refresh(item, ["starred"])
         assert item.starred is True
 
-    @pytest.mark.asyncio
     async def test_unstar_item(self, db_session: Session):
         """Test DELETE unstars an item."""
         item = create_item(db_session, "тест")
@@ -1062,10 +1011,9 @@ class TestItemsStarEndpoint:
 
             assert response.status_code == 204
 
-        db_session.refresh(item)
+        db_session.refresh(item, ["starred"])
         assert item.starred is False
 
-    @pytest.mark.asyncio
     async def test_unstar_item_is_idempotent(self, db_session: Session):
         """Test DELETE /star on an already-unstarred item is a no-op."""
         item = create_item(db_session, "тест")
@@ -1075,10 +1023,9 @@ class TestItemsStarEndpoint:
 
             assert response.status_code == 204
 
-        db_session.refresh(item)
+        db_session.refresh(item, ["starred"])
         assert item.starred is False
 
-    @pytest.mark.asyncio
     async def test_star_item_not_found(self):
         """Test PUT /star returns 404 for unknown item."""
         async with http_client() as client:
@@ -1086,7 +1033,6 @@ class TestItemsStarEndpoint:
 
             assert response.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_unstar_item_not_found(self):
         """Test DELETE /star returns 404 for unknown item."""
         async with http_client() as client:
@@ -1,14 +1,11 @@
 """Integration tests for /api/logs endpoint."""
 
-import pytest
-
 from tests.integration.helpers import http_client
 
 
 class TestLogsEndpoint:
     """Tests for /api/logs endpoint."""
 
-    @pytest.mark.asyncio
     async def test_receive_frontend_log(self):
         """Test POST /api/logs accepts and acknowledges frontend log."""
         async with http_client() as client:
@@ -24,7 +21,6 @@ class TestLogsEndpoint:
             assert response.status_code == 200
             assert response.json() == {"status": "ok"}
 
-    @pytest.mark.asyncio
     async def test_receive_frontend_log_all_levels(self):
         """Test POST /api/logs accepts all log levels."""
         async with http_client() as client:
@@ -41,7 +37,6 @@ class TestLogsEndpoint:
                 assert response.status_code == 200
                 assert response.json() == {"status": "ok"}
 
-    @pytest.mark.asyncio
     async def test_receive_frontend_log_with_args(self):
         """Test POST /api/logs includes args in logged message."""
         async with http_client() as client:
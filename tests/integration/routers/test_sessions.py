@@ -3,8 +3,6 @@
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
-import pytest
-
 from tests.integration.helpers import (
     DEFAULT_LANGUAGE,
     FAKE_UUID,
@@ -21,7 +19,6 @@ if TYPE_CHECKING:
 class TestSessionsEndpoints:
     """Tests for /api/sessions endpoints."""
 
-    @pytest.mark.asyncio
     async def test_list_sessions_empty(self):
         """Test GET /api/sessions returns empty list when no sessions exist."""
         async with http_client() as client:
@@ -31,7 +28,6 @@ class TestSessionsEndpoints:
             data = response.json()
             assert data["sessions"] == []
 
-    @pytest.mark.asyncio
     async def test_list_sessions_with_data(self, db_session: Session):
         """Test GET /api/sessions returns all sessions with item counts."""
         # Create test sessions
@@ -65,7 +61,6 @@ class TestSessionsEndpoints:
             assert sessions_by_id[str(session2.id)]["item_count"] == 1
             assert sessions_by_id[str(session2.id)]["ended_at"] is not None
 
-    @pytest.mark.asyncio
     async def test_get_session_detail(self, db_session: Session):
         """Test GET /api/sessions/{id} returns session with items in order."""
         session = create_session(db_session)
@@ -100,7 +95,6 @@ class TestSessionsEndpoints:
             assert data["items"][1]["text"] == "второй"
             assert data["items"][2]["text"] == "третий"
 
-    @pytest.mark.asyncio
     async def test_get_session_not_found(self):
         """Test GET /api/sessions/{id} returns 404 for non-existent session."""
         async with http_client() as client:
@@ -109,7 +103,6 @@ class TestSessionsEndpoints:
             assert response.status_code == 404
             assert response.json()["detail"] == "Session not found"
 
-    @pytest.mark.asyncio
     async def test_delete_session(self, db_session: Session):
         """Test DELETE /api/sessions/{id} deletes session."""
         session = create_session(db_session)
@@ -124,7 +117,6 @@ class TestSessionsEndpoints:
             response = await client.get(f"/api/sessions/{session.id}")
             assert response.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_delete_session_not_found(self):
         """Test DELETE /api/sessions/{id} returns 404 for non-existent session."""
         async with http_client() as client:
@@ -133,7 +125,6 @@ class TestSessionsEndpoints:
             assert response.status_code == 404
             assert response.json()["detail"] == "Session not found"
 
-    @pytest.mark.asyncio
     async def test_delete_session_cascades_to_session_items(self, db_session: Session):
         """Test deleting a session also deletes its session items."""
         session = create_session(db_session)
@@ -151,7 +142,6 @@ class TestSessionsEndpoints:
             assert response.json()["usage_count"] == 0
             assert response.json()["last_used_at"] is None
 
-    @pytest.mark.asyncio
     async def test_delete_session_item(self, db_session: Session):
         """Test DELETE /api/sessions/{id}/items/{item_id} deletes session item."""
         session = create_session(db_session)
@@ -179,7 +169,6 @@ class TestSessionsEndpoints:
             assert len(data["items"]) == 1
             assert data["items"][0]["text"] == "второй"
 
-    @pytest.mark.asyncio
     async def test_delete_session_item_session_not_found(self, db_session: Session):
         """Test DELETE returns 404 when session doesn't exist."""
         item = create_item(db_session, "элемент")
@@ -196,7 +185,6 @@ class TestSessionsEndpoints:
             assert response.status_code == 404
             assert response.json()["detail"] == "Session not found"
 
-    @pytest.mark.asyncio
     async def test_delete_session_item_not_found(self, db_session: Session):
         """Test DELETE returns 404 when session item doesn't exist."""
         session = create_session(db_session)
@@ -209,7 +197,6 @@ class TestSessionsEndpoints:
             assert response.status_code == 404
             assert response.json()["detail"] == "Session item not found"
 
-    @pytest.mark.asyncio
     async def test_delete_session_item_wrong_session(self, db_session: Session):
         """Test DELETE returns 404 when session item belongs to different session."""
         session1 = create_session(db_session)
@@ -10,29 +10,35 @@ from chitai.db.models import Session as DBSession
 from chitai.server.app import app
 
 from .helpers import (
+    ADVANCE_BACKWARD,
+    ADVANCE_FORWARD,
+    END_SESSION,
+    NEXT_ITEM,
+    START_SESSION,
+    add_items,
+    assert_no_message,
     connect_clients,
     connect_controller,
     connect_display,
+    create_item,
+    get_items_by_text,
+    get_session_items_by_item_id,
+    receive_from_all,
     send_add_item,
+    send_all,
     started_session,
 )
 
 
-@pytest.mark.asyncio
-async def test_controller_connection():
-    """Test that controller can connect successfully."""
-    async with connect_controller() as controller_ws:
-        assert controller_ws is not None
-
-
-@pytest.mark.asyncio
-async def test_display_connection():
-    """Test that display can connect successfully."""
-    async with connect_display() as display_ws:
-        assert display_ws is not None
+@pytest.mark.parametrize(
+    "connect", [connect_controller, connect_display], ids=["controller", "display"]
+)
+async def test_connection(connect):
+    """Test that each client role can connect successfully."""
+    async with connect() as ws:
+        assert ws is not None
 
 
-@pytest.mark.asyncio
 async def test_controller_sets_state():
     """Test that controller can set text state and receives state broadcast."""
     async with started_session() as (controller_ws, _, _):
@@ -40,11 +46,11 @@ async def test_controller_sets_state():
         data = await controller_ws.receive_json()
         assert data["type"] == "state"
         assert data["payload"]["words"] == ["молоко", "хлеб"]
-        assert app.state.context.session.words == ["молоко", "хлеб"]
-        assert app.state.context.session.current_word_index == 0
+        session_state = app.state.context.session
+        assert session_state.words == ["молоко", "хлеб"]
+        assert session_state.current_word_index == 0
 
 
-@pytest.mark.asyncio
 async def test_display_receives_state():
     """Test that display receives current state on connect."""
     app.state.context.session.set_text("черепаха молоко")
@@ -56,7 +62,6 @@ async def test_display_receives_state():
         assert data["payload"]["current_word_index"] == 0
 
 
-@pytest.mark.asyncio
 async def test_controller_to_display_flow():
     """Test basic flow: controller sends text, display receives it."""
     async with started_session() as (controller_ws, display_ws, _):
@@ -68,42 +73,26 @@ async def test_controller_to_display_flow():
         assert data["payload"]["current_word_index"] == 0
 
 
-@pytest.mark.asyncio
-async def test_advance_word_forward():
-    """Test advancing to next word broadcasts state."""
+async def test_advance_word(subtests: pytest.Subtests):
+    """Test advancing forward and backward through words broadcasts state."""
+    steps = [
+        ("forward", ADVANCE_FORWARD, 1),
+        ("forward again", ADVANCE_FORWARD, 2),
+        ("backward", ADVANCE_BACKWARD, 1),
+    ]
     async with started_session() as (controller_ws, display_ws, _):
         await send_add_item(controller_ws, "один два три")
         await display_ws.receive_json()  # State after add_item
 
-        await controller_ws.send_json({"type": "advance_word", "payload": {"delta": 1}})
-
-        data = await display_ws.receive_json()
-        assert data["type"] == "state"
-        assert data["payload"]["current_word_index"] == 1
+        for name, message, expected_index in steps:
+            with subtests.test(name):
+                await controller_ws.send_text(message)
 
+                data = await display_ws.receive_json()
+                assert data["type"] == "state"
+                assert data["payload"]["current_word_index"] == expected_index
 
-@pytest.mark.asyncio
-async def test_advance_word_backward():
-    """Test going back to previous word broadcasts state."""
-    async with started_session() as (controller_ws, display_ws, _):
-        await send_add_item(controller_ws, "один два три")
-        await display_ws.receive_json()  # State after add_item
 
-        await controller_ws.send_json({"type": "advance_word", "payload": {"delta": 1}})
-        await display_ws.receive_json()
-        await controller_ws.send_json({"type": "advance_word", "payload": {"delta": 1}})
-        await display_ws.receive_json()
-
-        await controller_ws.send_json(
-            {"type": "advance_word", "payload": {"delta": -1}}
-        )
-
-        data = await display_ws.receive_json()
-        assert data["type"] == "state"
-        assert data["payload"]["current_word_index"] == 1
-
-
-@pytest.mark.asyncio
 async def test_start_session(db_session):
     """Test that start_session creates a database session."""
     async with connect_controller() as controller_ws:
@@ -115,7 +104,7 @@ async def test_start_session(db_session):
         assert initial_state["payload"]["current_word_index"] is None
         assert initial_state["payload"]["queue"] == []
 
-        await controller_ws.send_json({"type": "start_session"})
+        await controller_ws.send_text(START_SESSION)
 
         data = await controller_ws.receive_json()
         assert data["type"] == "state"
@@ -133,17 +122,14 @@ async def test_start_session(db_session):
         assert db_session_obj.ended_at is None
 
 
-@pytest.mark.asyncio
 async def test_end_session(db_session):
     """Test that end_session marks session as ended."""
-    async with connect_controller() as controller_ws:
-        await controller_ws.receive_json()  # Initial state
-
-        await controller_ws.send_json({"type": "start_session"})
+    async with connect_controller(skip_initial_state=True) as controller_ws:
+        await controller_ws.send_text(START_SESSION)
         start_data = await controller_ws.receive_json()
         session_id = start_data["payload"]["session_id"]
 
-        await controller_ws.send_json({"type": "end_session"})
+        await controller_ws.send_text(END_SESSION)
 
         data = await controller_ws.receive_json()
         assert data["type"] == "state"
@@ -156,17 +142,14 @@ async def test_end_session(db_session):
         assert db_session_obj.ended_at is not None
 
 
-@pytest.mark.asyncio
 async def test_start_session_broadcasts_to_all_clients():
     """Test that state is broadcast to all connected clients when session starts."""
-    async with connect_clients() as (controller_ws, display_ws):
-        await display_ws.receive_json()  # Initial state
-        await controller_ws.receive_json()  # Initial state
-
-        await controller_ws.send_json({"type": "start_session"})
+    async with connect_clients(skip_initial_state=True) as (controller_ws, display_ws):
+        await controller_ws.send_text(START_SESSION)
 
-        controller_data = await controller_ws.receive_json()
-        display_data = await display_ws.receive_json()
+        controller_data, display_data = await receive_from_all(
+            controller_ws, display_ws
+        )
 
         assert controller_data["type"] == "state"
         assert display_data["type"] == "state"
@@ -177,32 +160,25 @@ async def test_start_session_broadcasts_to_all_clients():
         )
 
 
-@pytest.mark.asyncio
 async def test_ignore_duplicate_start_session():
     """Test that second start_session is ignored if session already active."""
-    async with connect_controller() as controller_ws:
-        await controller_ws.receive_json()  # Initial state
-
-        await controller_ws.send_json({"type": "start_session"})
+    async with connect_controller(skip_initial_state=True) as controller_ws:
+        await controller_ws.send_text(START_SESSION)
         data1 = await controller_ws.receive_json()
         session_id1 = data1["payload"]["session_id"]
 
-        await controller_ws.send_json({"type": "start_session"})
+        await controller_ws.send_text(START_SESSION)
 
-        with pytest.raises(asyncio.TimeoutError):
-            await asyncio.wait_for(controller_ws.receive_json(), timeout=0.1)
+        await assert_no_message(controller_ws)
 
         assert app.state.context.session.session_id == session_id1
 
 
-@pytest.mark.asyncio
 async def test_reconnecting_client_receives_current_state():
     """Test that clients connecting to active session receive current state."""
-    async with connect_controller() as controller_ws:
-        await controller_ws.receive_json()  # Initial state
-
+    async with connect_controller(skip_initial_state=True) as controller_ws:
         # Start a session
-        await controller_ws.send_json({"type": "start_session"})
+        await controller_ws.send_text(START_SESSION)
         data = await controller_ws.receive_json()
         session_id = data["payload"]["session_id"]
 
@@ -214,42 +190,32 @@ async def test_reconnecting_client_receives_current_state():
         assert data["payload"]["session_id"] == session_id
 
 
-@pytest.mark.asyncio
 async def test_add_item_creates_item_and_session_item(db_session):
     """Test that add_item creates Item and SessionItem in database."""
     async with started_session() as (controller_ws, _, session_id):
         await send_add_item(controller_ws, "молоко")
         await controller_ws.receive_json()  # state broadcast
 
-        # Verify Item was created
-        item = db_session.scalars(select(Item).where(Item.text == "молоко")).first()
-        assert item is not None
-        assert item.language == "ru"
-
-        # Verify SessionItem was created
-        session_item = db_session.scalars(
-            select(SessionItem).where(
-                SessionItem.session_id == session_id, SessionItem.item_id == item.id
-            )
-        ).first()
+        # Verify current_session_item_id is set and points at a new SessionItem
+        session_item_id = app.state.context.session.current_session_item_id
+        assert session_item_id is not None
+        session_item = db_session.get(SessionItem, session_item_id)
         assert session_item is not None
+        assert session_item.session_id == session_id
         assert session_item.displayed_at is not None
         assert session_item.completed_at is None
 
-        # Verify current_session_item_id is set
-        assert app.state.context.session.current_session_item_id == session_item.id
+        # Verify Item was created
+        item = session_item.item
+        assert item.text == "молоко"
+        assert item.language == "ru"
 
 
-@pytest.mark.asyncio
 async def test_add_item_reuses_existing_item(db_session):
     """Test that add_item reuses existing Item with same text."""
     async with started_session() as (controller_ws, _, session_id):
         # Add same item twice
-        await send_add_item(controller_ws, "хлеб")
-        await controller_ws.receive_json()
-
-        await send_add_item(controller_ws, "хлеб")
-        await controller_ws.receive_json()
+        await add_items(controller_ws, ["хлеб", "хлеб"])
 
         # Verify only one Item was created
         items = db_session.scalars(select(Item).where(Item.text == "хлеб")).all()
@@ -265,96 +231,53 @@ async def test_add_item_reuses_existing_item(db_session):
         assert len(session_items) == 2
 
 
-@pytest.mark.asyncio
 async def test_add_item_queues_when_item_displayed(db_session):
     """Test that adding item when one is displayed adds to queue."""
     async with started_session() as (controller_ws, _, session_id):
-        # Add first item
-        await send_add_item(controller_ws, "первый")
-        state = await controller_ws.receive_json()
-        assert state["payload"]["queue"] == []
+        # Add first item, then second item while the first is displayed
+        states = await add_items(controller_ws, ["первый", "второй"])
+        assert states[0]["payload"]["queue"] == []
+        state = states[-1]
 
-        # Get first item's SessionItem
-        item1 = db_session.scalars(select(Item).where(Item.text == "первый")).first()
-        assert item1 is not None
-        session_item1 = db_session.scalars(
-            select(SessionItem).where(
-                SessionItem.session_id == session_id, SessionItem.item_id == item1.id
-            )
-        ).first()
-        assert session_item1 is not None
-        assert session_item1.displayed_at is not None
-        assert session_item1.completed_at is None
-        session_item1_id = session_item1.id
+        items = get_items_by_text(db_session, ["первый", "второй"])
+        session_items = get_session_items_by_item_id(db_session, session_id)
 
-        # Add second item
-        await send_add_item(controller_ws, "второй")
-        state = await controller_ws.receive_json()
-
-        # Verify first SessionItem is still active (not completed)
-        db_session.expire_all()  # Refresh data from database
-        session_item1 = db_session.get(SessionItem, session_item1_id)
-        assert session_item1 is not None
+        # Verify first SessionItem is displayed and still active (not completed)
+        session_item1 = session_items[items["первый"].id]
+        assert session_item1.displayed_at is not None
         assert session_item1.completed_at is None
 
         # Verify second item was added to queue
         assert len(state["payload"]["queue"]) == 1
         assert state["payload"]["queue"][0]["text"] == "второй"
 
-        item2 = db_session.scalars(select(Item).where(Item.text == "второй")).first()
-        assert item2 is not None
-        session_item2 = db_session.scalars(
-            select(SessionItem).where(
-                SessionItem.session_id == session_id, SessionItem.item_id == item2.id
-            )
-        ).first()
-        assert session_item2 is not None
+        session_item2 = session_items[items["второй"].id]
         assert session_item2.displayed_at is None
         assert session_item2.completed_at is None
 
 
-@pytest.mark.asyncio
 async def test_next_item_advances_through_queue(db_session):
     """Test that next_item advances through queued items."""
-    async with started_session() as (controller_ws, _, session_id):
+    async with started_session() as (controller_ws, _, _):
         # Add three items
-        await send_add_item(controller_ws, "один")
-        state = await controller_ws.receive_json()
-        assert state["payload"]["words"] == ["один"]
-        assert len(state["payload"]["queue"]) == 0
-
-        await send_add_item(controller_ws, "два")
-        state = await controller_ws.receive_json()
-        assert len(state["payload"]["queue"]) == 1
-
-        await send_add_item(controller_ws, "три")
-        state = await controller_ws.receive_json()
-        assert len(state["payload"]["queue"]) == 2
-
-        # Get SessionItem IDs for verification
-        item1 = db_session.scalars(select(Item).where(Item.text == "один")).first()
-        item2 = db_session.scalars(select(Item).where(Item.text == "два")).first()
+        states = await add_items(controller_ws, ["один", "два", "три"])
+        assert states[0]["payload"]["words"] == ["один"]
+        assert len(states[0]["payload"]["queue"]) == 0
+        assert len(states[1]["payload"]["queue"]) == 1
+        assert len(states[2]["payload"]["queue"]) == 2
 
-        session_item1 = db_session.scalars(
-            select(SessionItem).where(
-                SessionItem.session_id == session_id, SessionItem.item_id == item1.id
-            )
-        ).first()
-        session_item2 = db_session.scalars(
-            select(SessionItem).where(
-                SessionItem.session_id == session_id, SessionItem.item_id == item2.id
-            )
-        ).first()
+        # SessionItem IDs of the displayed item and the head of the queue
+        session_item1_id = app.state.context.session.current_session_item_id
+        session_item2_id = states[2]["payload"]["queue"][0]["session_item_id"]
 
         # Advance to next item
-        await controller_ws.send_json({"type": "next_item"})
+        await controller_ws.send_text(NEXT_ITEM)
         state = await controller_ws.receive_json()
 
         # Verify first item NOT completed (never advanced past last word), second item
         # displayed
-        db_session.expire_all()
-        session_item1 = db_session.get(SessionItem, session_item1.id)
-        session_item2 = db_session.get(SessionItem, session_item2.id)
+        session_item1 = db_session.get(SessionItem, session_item1_id)
+        session_item2 = db_session.get(SessionItem, session_item2_id)
 
         assert session_item1.completed_at is None
         assert session_item2.displayed_at is not None
@@ -363,14 +286,13 @@ async def test_next_item_advances_through_queue(db_session):
         assert len(state["payload"]["queue"]) == 1
 
         # Advance to third item
-        await controller_ws.send_json({"type": "next_item"})
+        await controller_ws.send_text(NEXT_ITEM)
         state = await controller_ws.receive_json()
 
         assert state["payload"]["words"] == ["три"]
         assert len(state["payload"]["queue"]) == 0
 
 
-@pytest.mark.asyncio
 async def test_next_item_with_empty_queue():
     """Test that next_item with empty queue does nothing."""
     async with started_session() as (controller_ws, _, _):
@@ -380,14 +302,13 @@ async def test_next_item_with_empty_queue():
         assert state["payload"]["words"] == ["один"]
 
         # Try to advance with empty queue
-        await controller_ws.send_json({"type": "next_item"})
+        await controller_ws.send_text(NEXT_ITEM)
         state = await controller_ws.receive_json()
 
         # Should still show same item
         assert state["payload"]["words"] == ["один"]
 
 
-@pytest.mark.asyncio
 async def test_end_session_does_not_complete_items(db_session):
     """Test that ending session does NOT auto-complete SessionItems.
 
@@ -397,59 +318,44 @@ async def test_end_session_does_not_complete_items(db_session):
     """
     async with started_session() as (controller_ws, _, session_id):
         # Add two items (first displayed, second queued)
-        await send_add_item(controller_ws, "один")
-        await controller_ws.receive_json()
-
-        await send_add_item(controller_ws, "два")
-        await controller_ws.receive_json()
+        await add_items(controller_ws, ["один", "два"])
 
         # End session without advancing
-        await controller_ws.send_json({"type": "end_session"})
+        await controller_ws.send_text(END_SESSION)
         await controller_ws.receive_json()
 
         # Verify SessionItems are NOT auto-completed
-        session_items = db_session.scalars(
-            select(SessionItem).where(SessionItem.session_id == session_id)
+        rows = db_session.execute(
+            select(Item.text, SessionItem.displayed_at, SessionItem.completed_at)
+            .join(SessionItem, SessionItem.item_id == Item.id)
+            .where(SessionItem.session_id == session_id)
         ).all()
-        assert len(session_items) == 2
+        assert len(rows) == 2
+        timestamps_by_text = {
+            text: (displayed, completed) for text, displayed, completed in rows
+        }
 
         # First item was displayed but not completed
-        item1 = db_session.scalars(select(Item).where(Item.text == "один")).first()
-        session_item1 = db_session.scalars(
-            select(SessionItem).where(
-                SessionItem.session_id == session_id, SessionItem.item_id == item1.id
-            )
-        ).first()
-        assert session_item1.displayed_at is not None
-        assert session_item1.completed_at is None
+        displayed_at, completed_at = timestamps_by_text["один"]
+        assert displayed_at is not None
+        assert completed_at is None
 
         # Second item was queued but never displayed
-        item2 = db_session.scalars(select(Item).where(Item.text == "два")).first()
-        session_item2 = db_session.scalars(
-            select(SessionItem).where(
-                SessionItem.session_id == session_id, SessionItem.item_id == item2.id
-            )
-        ).first()
-        assert session_item2.displayed_at is None
-        assert session_item2.completed_at is None
+        assert timestamps_by_text["два"] == (None, None)
 
 
-@pytest.mark.asyncio
 async def test_add_item_without_session_is_ignored(db_session):
     """Test that add_item without active session is ignored.
 
     The item is created via REST API, but the WebSocket add_item message
     is ignored because there's no active session, so no SessionItem is created.
     """
-    async with connect_controller() as controller_ws:
-        await controller_ws.receive_json()  # Initial state
-
+    async with connect_controller(skip_initial_state=True) as controller_ws:
         # Try to add item without starting session
         await send_add_item(controller_ws, "молоко")
 
         # Should not receive state broadcast (ignored)
-        with pytest.raises(asyncio.TimeoutError):
-            await asyncio.wait_for(controller_ws.receive_json(), timeout=0.1)
+        await assert_no_message(controller_ws)
 
         # Item was created via REST, but no SessionItem exists
         items = db_session.scalars(select(Item).where(Item.text == "молоко")).all()
@@ -462,7 +368,6 @@ async def test_add_item_without_session_is_ignored(db_session):
         assert len(session_items) == 0
 
 
-@pytest.mark.asyncio
 async def test_add_item_with_missing_database_session_resets_state(db_session):
     """Test that missing database session triggers state reset and broadcast."""
     async with started_session() as (controller_ws, display_ws, session_id):
@@ -476,13 +381,14 @@ async def test_add_item_with_missing_database_session_resets_state(db_session):
         await send_add_item(controller_ws, "молоко")
 
         # Should receive state broadcast with reset state
-        controller_data = await controller_ws.receive_json()
+        controller_data, display_data = await receive_from_all(
+            controller_ws, display_ws
+        )
         assert controller_data["type"] == "state"
         assert controller_data["payload"]["session_id"] is None
         assert controller_data["payload"]["language"] is None
         assert controller_data["payload"]["words"] == []
 
-        display_data = await display_ws.receive_json()
         assert display_data["type"] == "state"
         assert display_data["payload"]["session_id"] is None
         assert display_data["payload"]["language"] is None
@@ -491,45 +397,43 @@ async def test_add_item_with_missing_database_session_resets_state(db_session):
         assert app.state.context.session.session_id is None
 
 
-@pytest.mark.asyncio
+@pytest.mark.usefixtures("short_grace_period")
 async def test_grace_period_auto_ends_inactive_session(db_session):
     """Test that inactive sessions are automatically ended after grace period."""
-    app.state.context.grace_timer.grace_period_seconds = 0.1
+    session_state = app.state.context.session
+    grace_timer = app.state.context.grace_timer
 
     async with started_session() as (controller_ws, _, session_id):
         await send_add_item(controller_ws, "молоко")
         await controller_ws.receive_json()
 
     # Session should still be active, regardless of client disconnection
-    assert app.state.context.session.session_id is not None
+    assert session_state.session_id is not None
 
     # Wait for grace period to expire
-    await asyncio.sleep(0.15)
+    await asyncio.wait_for(grace_timer.wait(), timeout=1)
 
     # Session should be auto-ended
-    assert app.state.context.session.session_id is None
+    assert session_state.session_id is None
 
     # Verify in database
-    db_session.expire_all()
     session_obj = db_session.get(DBSession, session_id)
     assert session_obj.ended_at is not None
 
 
-@pytest.mark.asyncio
+@pytest.mark.usefixtures("short_grace_period")
 async def test_grace_timer_not_started_without_active_session():
     """Test that grace timer doesn't start if no session is active."""
-    app.state.context.grace_timer.grace_period_seconds = 0.1
-
     # Connect and disconnect without starting a session
-    async with connect_controller() as controller_ws:
-        await controller_ws.receive_json()  # Initial state
+    async with connect_controller(skip_initial_state=True):
+        pass
 
     # Grace timer should not be running
     assert not app.state.context.grace_timer.is_running
 
 
-@pytest.mark.asyncio
-async def test_complete_session_flow_end_to_end(db_session):  # noqa: PLR0915
+@pytest.mark.slow
+async def test_complete_session_flow_end_to_end(db_session):
     """Test complete realistic session flow from start to finish.
 
     This test simulates a typical parent-child reading session:
@@ -543,96 +447,61 @@ async def test_complete_session_flow_end_to_end(db_session):  # noqa: PLR0915
     """
     async with started_session() as (controller_ws, _, session_id):
         # Build a queue with three items
-        await send_add_item(controller_ws, "черепаха ползёт")
-        state = await controller_ws.receive_json()
-
-        assert state["payload"]["words"] == ["черепаха", "ползёт"]
-        assert state["payload"]["current_word_index"] == 0
-        assert len(state["payload"]["queue"]) == 0
-
-        await send_add_item(controller_ws, "мама готовит обед")
-        state = await controller_ws.receive_json()
+        states = await add_items(
+            controller_ws, ["черепаха ползёт", "мама готовит обед", "солнце светит"]
+        )
 
-        assert len(state["payload"]["queue"]) == 1
-        assert state["payload"]["queue"][0]["text"] == "мама готовит обед"
+        assert states[0]["payload"]["words"] == ["черепаха", "ползёт"]
+        assert states[0]["payload"]["current_word_index"] == 0
+        assert len(states[0]["payload"]["queue"]) == 0
 
-        await send_add_item(controller_ws, "солнце светит")
-        state = await controller_ws.receive_json()
+        assert len(states[1]["payload"]["queue"]) == 1
+        assert states[1]["payload"]["queue"][0]["text"] == "мама готовит обед"
 
+        state = states[-1]
         assert len(state["payload"]["queue"]) == 2
 
         # Read through first item word-by-word
         assert state["payload"]["current_word_index"] == 0
 
-        await controller_ws.send_json({"type": "advance_word", "payload": {"delta": 1}})
-        state = await controller_ws.receive_json()
-
-        assert state["payload"]["current_word_index"] == 1
-        assert state["payload"]["words"] == ["черепаха", "ползёт"]
-
-        # Go back to first word (parent correcting)
-        await controller_ws.send_json(
-            {"type": "advance_word", "payload": {"delta": -1}}
+        # Advance, go back to first word (parent correcting), advance to second word
+        # again, then complete first item by advancing past last word
+        states = await send_all(
+            controller_ws,
+            [ADVANCE_FORWARD, ADVANCE_BACKWARD, ADVANCE_FORWARD, ADVANCE_FORWARD],
         )
-        state = await controller_ws.receive_json()
-
-        assert state["payload"]["current_word_index"] == 0
-
-        # Advance to second word again
-        await controller_ws.send_json({"type": "advance_word", "payload": {"delta": 1}})
-        state = await controller_ws.receive_json()
-
-        assert state["payload"]["current_word_index"] == 1
 
-        # Complete first item by advancing past last word
-        await controller_ws.send_json({"type": "advance_word", "payload": {"delta": 1}})
-        state = await controller_ws.receive_json()
-
-        assert state["payload"]["current_word_index"] is None
+        assert states[0]["payload"]["words"] == ["черепаха", "ползёт"]
+        assert [s["payload"]["current_word_index"] for s in states] == [1, 0, 1, None]
 
-        # Advance to next item in queue
-        await controller_ws.send_json({"type": "next_item"})
-        state = await controller_ws.receive_json()
+        # Advance to next item in queue, read through it quickly ("мама готовит обед"
+        # has 3 words) and complete it by advancing past last word, advance to third
+        # item, then end session. No message depends on a previous reply, so they are
+        # all sent back-to-back.
+        states = await send_all(
+            controller_ws,
+            [NEXT_ITEM, *[ADVANCE_FORWARD] * 3, NEXT_ITEM, END_SESSION],
+        )
 
+        state = states[0]
         assert state["payload"]["words"] == ["мама", "готовит", "обед"]
         assert state["payload"]["current_word_index"] == 0
         assert len(state["payload"]["queue"]) == 1
         assert state["payload"]["queue"][0]["text"] == "солнце светит"
 
-        # Read through second item quickly ("мама готовит обед" has 3 words)
-        await controller_ws.send_json({"type": "advance_word", "payload": {"delta": 1}})
-        await controller_ws.receive_json()
-
-        await controller_ws.send_json({"type": "advance_word", "payload": {"delta": 1}})
-        state = await controller_ws.receive_json()
-
-        assert state["payload"]["current_word_index"] == 2
-
-        # Complete second item by advancing past last word
-        await controller_ws.send_json({"type": "advance_word", "payload": {"delta": 1}})
-        state = await controller_ws.receive_json()
-
-        assert state["payload"]["current_word_index"] is None
-
-        # Advance to third item
-        await controller_ws.send_json({"type": "next_item"})
-        state = await controller_ws.receive_json()
+        assert [s["payload"]["current_word_index"] for s in states[1:4]] == [1, 2, None]
 
+        state = states[4]
         assert state["payload"]["words"] == ["солнце", "светит"]
         assert state["payload"]["current_word_index"] == 0
         assert len(state["payload"]["queue"]) == 0
 
-        # End session
-        await controller_ws.send_json({"type": "end_session"})
-        state = await controller_ws.receive_json()
-
+        state = states[5]
         assert state["payload"]["session_id"] is None
         assert state["payload"]["language"] is None
         assert app.state.context.session.session_id is None
 
     # Verify database state
-    db_session.expire_all()
-
     session_obj = db_session.get(DBSession, session_id)
     assert session_obj is not None
     assert session_obj.ended_at is not None
@@ -645,30 +514,12 @@ async def test_complete_session_flow_end_to_end(db_session):  # noqa: PLR0915
     assert "мама готовит обед" in items_by_text
     assert "солнце светит" in items_by_text
 
-    session_items = db_session.scalars(
-        select(SessionItem).where(SessionItem.session_id == session_id)
-    ).all()
+    session_items = get_session_items_by_item_id(db_session, session_id)
     assert len(session_items) == 3
 
-    item1 = items_by_text["черепаха ползёт"]
-    item2 = items_by_text["мама готовит обед"]
-    item3 = items_by_text["солнце светит"]
-
-    session_item1 = db_session.scalars(
-        select(SessionItem).where(
-            SessionItem.session_id == session_id, SessionItem.item_id == item1.id
-        )
-    ).first()
-    session_item2 = db_session.scalars(
-        select(SessionItem).where(
-            SessionItem.session_id == session_id, SessionItem.item_id == item2.id
-        )
-    ).first()
-    session_item3 = db_session.scalars(
-        select(SessionItem).where(
-            SessionItem.session_id == session_id, SessionItem.item_id == item3.id
-        )
-    ).first()
+    session_item1 = session_items[items_by_text["черепаха ползёт"].id]
+    session_item2 = session_items[items_by_text["мама готовит обед"].id]
+    session_item3 = session_items[items_by_text["солнце светит"].id]
 
     # First two items completed, third displayed but not completed
     assert session_item1.displayed_at is not None
@@ -681,7 +532,6 @@ async def test_complete_session_flow_end_to_end(db_session):  # noqa: PLR0915
     assert session_item3.completed_at is None
 
 
-@pytest.mark.asyncio
 async def test_completed_state_flow():
     """Test item completed state flow.
 
@@ -701,30 +551,17 @@ async def test_completed_state_flow():
         assert state["payload"]["current_word_index"] == 0
         assert len(state["payload"]["queue"]) == 0
 
-        # Advance to second word
-        await controller_ws.send_json({"type": "advance_word", "payload": {"delta": 1}})
-        state = await controller_ws.receive_json()
-        assert state["payload"]["current_word_index"] == 1
-
-        # Advance to last word
-        await controller_ws.send_json({"type": "advance_word", "payload": {"delta": 1}})
-        state = await controller_ws.receive_json()
-        assert state["payload"]["current_word_index"] == 2
-
-        # Advance past last word - mark as completed (current_word_index → None)
-        await controller_ws.send_json({"type": "advance_word", "payload": {"delta": 1}})
-        state = await controller_ws.receive_json()
-        assert state["payload"]["current_word_index"] is None
-        assert state["payload"]["words"] == ["один", "два", "три"]
+        # Advance to second word, to last word, then past last word - mark as
+        # completed (current_word_index → None)
+        states = await send_all(controller_ws, [ADVANCE_FORWARD] * 3)
+        assert [s["payload"]["current_word_index"] for s in states] == [1, 2, None]
+        assert states[-1]["payload"]["words"] == ["один", "два", "три"]
 
         # Try to go back - should not work (no state broadcast expected)
-        await controller_ws.send_json(
-            {"type": "advance_word", "payload": {"delta": -1}}
-        )
+        await controller_ws.send_text(ADVANCE_BACKWARD)
 
         # Should not receive any state update since advance failed
-        with pytest.raises(asyncio.TimeoutError):
-            await asyncio.wait_for(controller_ws.receive_json(), timeout=0.1)
+        await assert_no_message(controller_ws)
 
         # Add item to queue while in completed state
         await send_add_item(controller_ws, "новый текст")
@@ -737,7 +574,7 @@ async def test_completed_state_flow():
         assert state["payload"]["queue"][0]["text"] == "новый текст"
 
         # Advance from completed state to next item
-        await controller_ws.send_json({"type": "next_item"})
+        await controller_ws.send_text(NEXT_ITEM)
         state = await controller_ws.receive_json()
 
         # Should now be on the new item at first word
@@ -746,7 +583,6 @@ async def test_completed_state_flow():
         assert len(state["payload"]["queue"]) == 0
 
 
-@pytest.mark.asyncio
 async def test_illustration_id_none_when_item_has_no_illustrations():
     """Test that illustration_id is None when item has no illustrations."""
     async with started_session() as (controller_ws, _, _):
@@ -756,15 +592,10 @@ async def test_illustration_id_none_when_item_has_no_illustrations():
         assert state["payload"]["illustration_id"] is None
 
 
-@pytest.mark.asyncio
 async def test_illustration_id_populated_when_item_has_illustration(db_session):
     """Test that illustration_id is set when item has an illustration."""
     # Create item with illustration
-    item = db_session.scalars(select(Item).where(Item.text == "собака")).first()
-    if not item:
-        item = Item(language="ru", text="собака")
-        db_session.add(item)
-        db_session.commit()
+    item = create_item(db_session, "собака")
 
     illustration = Illustration(width=800, height=600, file_size_bytes=12345)
     db_session.add(illustration)
@@ -781,15 +612,10 @@ async def test_illustration_id_populated_when_item_has_illustration(db_session):
         assert state["payload"]["illustration_id"] == illustration.id
 
 
-@pytest.mark.asyncio
 async def test_illustration_id_selected_from_multiple(db_session):
     """Test that one illustration is randomly selected when item has multiple."""
     # Create item with two illustrations
-    item = db_session.scalars(select(Item).where(Item.text == "кошка")).first()
-    if not item:
-        item = Item(language="ru", text="кошка")
-        db_session.add(item)
-        db_session.commit()
+    item = create_item(db_session, "кошка")
 
     illustration1 = Illustration(width=800, height=600, file_size_bytes=12345)
     illustration2 = Illustration(width=1024, height=768, file_size_bytes=54321)
@@ -811,28 +637,18 @@ async def test_illustration_id_selected_from_multiple(db_session):
 
             # Move to next if queued
             if state["payload"]["queue"]:
-                await controller_ws.send_json({"type": "next_item"})
+                await controller_ws.send_text(NEXT_ITEM)
                 await controller_ws.receive_json()
 
     # Should have selected both illustrations at least once
     assert selected_ids == {illustration1.id, illustration2.id}
 
 
-@pytest.mark.asyncio
 async def test_illustration_id_changes_with_next_item(db_session):
     """Test that illustration_id changes when advancing to next item."""
     # Create two items with different illustrations
-    item1 = db_session.scalars(select(Item).where(Item.text == "первый")).first()
-    if not item1:
-        item1 = Item(language="ru", text="первый")
-        db_session.add(item1)
-        db_session.commit()
-
-    item2 = db_session.scalars(select(Item).where(Item.text == "второй")).first()
-    if not item2:
-        item2 = Item(language="ru", text="второй")
-        db_session.add(item2)
-        db_session.commit()
+    item1 = create_item(db_session, "первый")
+    item2 = create_item(db_session, "второй")
 
     illustration1 = Illustration(width=800, height=600, file_size_bytes=12345)
     illustration2 = Illustration(width=1024, height=768, file_size_bytes=54321)
@@ -845,32 +661,22 @@ async def test_illustration_id_changes_with_next_item(db_session):
     db_session.commit()
 
     async with started_session() as (controller_ws, _, _):
-        # Add first item
-        await send_add_item(controller_ws, "первый")
-        state1 = await controller_ws.receive_json()
+        # Add first item, then second item to queue
+        state1, _ = await add_items(controller_ws, ["первый", "второй"])
         assert state1["payload"]["illustration_id"] == illustration1.id
 
-        # Add second item to queue
-        await send_add_item(controller_ws, "второй")
-        await controller_ws.receive_json()
-
         # Advance to second item
-        await controller_ws.send_json({"type": "next_item"})
+        await controller_ws.send_text(NEXT_ITEM)
         state2 = await controller_ws.receive_json()
 
         # Should now have illustration2
         assert state2["payload"]["illustration_id"] == illustration2.id
 
 
-@pytest.mark.asyncio
 async def test_illustration_id_reset_on_session_end(db_session):
     """Test that illustration_id is cleared when session ends."""
     # Create item with illustration
-    item = db_session.scalars(select(Item).where(Item.text == "тест")).first()
-    if not item:
-        item = Item(language="ru", text="тест")
-        db_session.add(item)
-        db_session.commit()
+    item = create_item(db_session, "тест")
 
     illustration = Illustration(width=800, height=600, file_size_bytes=12345)
     db_session.add(illustration)
@@ -886,14 +692,13 @@ async def test_illustration_id_reset_on_session_end(db_session):
         assert state1["payload"]["illustration_id"] == illustration.id
 
         # End session
-        await controller_ws.send_json({"type": "end_session"})
+        await controller_ws.send_text(END_SESSION)
         state2 = await controller_ws.receive_json()
 
         # illustration_id should be cleared
         assert state2["payload"]["illustration_id"] is None
 
 
-@pytest.mark.asyncio
 async def test_illustration_id_none_initially():
     """Test that illustration_id is None in initial state."""
     async with connect_controller() as controller_ws:
@@ -903,7 +708,6 @@ async def test_illustration_id_none_initially():
         assert state["payload"]["illustration_id"] is None
 
 
-@pytest.mark.asyncio
 async def test_illustration_id_persisted_to_database_on_display(db_session):
     """Test that illustration_id is saved to database when item is displayed."""
     # Create item with illustration
@@ -934,7 +738,6 @@ async def test_illustration_id_persisted_to_database_on_display(db_session):
         assert session_item.displayed_at is not None
 
 
-@pytest.mark.asyncio
 async def test_illustration_id_null_when_no_illustrations(db_session):
     """Test that illustration_id is NULL in database when item has no illustrations."""
     async with started_session() as (controller_ws, _, session_id):
@@ -952,7 +755,6 @@ async def test_illustration_id_null_when_no_illustrations(db_session):
         assert session_item.displayed_at is not None
 
 
-@pytest.mark.asyncio
 async def test_illustration_id_persisted_on_next_item(db_session):
     """Test that illustration_id is saved when advancing to next queued item."""
     # Create two items with illustrations
@@ -973,14 +775,10 @@ async def test_illustration_id_persisted_on_next_item(db_session):
 
     async with started_session() as (controller_ws, _, session_id):
         # Add two items (first displays, second queues)
-        await send_add_item(controller_ws, "первая")
-        await controller_ws.receive_json()
-
-        await send_add_item(controller_ws, "вторая")
-        await controller_ws.receive_json()
+        await add_items(controller_ws, ["первая", "вторая"])
 
         # Advance to next item
-        await controller_ws.send_json({"type": "next_item"})
+        await controller_ws.send_text(NEXT_ITEM)
         await controller_ws.receive_json()
 
         # Verify both session_items have illustration_id persisted
@@ -993,7 +791,6 @@ async def test_illustration_id_persisted_on_next_item(db_session):
         assert session_items[1].illustration_id == illustration2.id
 
 
-@pytest.mark.asyncio
 async def test_queued_item_has_no_illustration_id_until_displayed(db_session):
     """Test that queued items don't have illustration_id until they're displayed."""
     # Create item with illustration
@@ -1010,13 +807,8 @@ async def test_queued_item_has_no_illustration_id_until_displayed(db_session):
     db_session.commit()
 
     async with started_session() as (controller_ws, _, session_id):
-        # Add first item (displays immediately)
-        await send_add_item(controller_ws, "первый без картинки")
-        await controller_ws.receive_json()
-
-        # Add second item (goes to queue)
-        await send_add_item(controller_ws, "очередь")
-        await controller_ws.receive_json()
+        # Add first item (displays immediately) and second item (goes to queue)
+        await add_items(controller_ws, ["первый без картинки", "очередь"])
 
         # Verify queued item has NULL illustration_id
         session_items = db_session.scalars(
@@ -1027,12 +819,11 @@ async def test_queued_item_has_no_illustration_id_until_displayed(db_session):
         assert queued_item.illustration_id is None
 
         # Now advance to queued item
-        await controller_ws.send_json({"type": "next_item"})
+        await controller_ws.send_text(NEXT_ITEM)
         await controller_ws.receive_json()
 
         # Refresh from database
-        db_session.expire_all()
-        queued_item = db_session.get(SessionItem, queued_item.id)
+        db_session.refresh(queued_item, ["illustration_id", "displayed_at"])
 
         # Now it should have illustration_id
         assert queued_item.illustration_id == illustration.id
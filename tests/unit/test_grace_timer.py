@@ -17,7 +17,50 @@ async def noop(_: datetime) -> None:
     """No-op callback for tests that don't care about expiry behavior."""
 
 
-@pytest.mark.asyncio
+class VirtualClock:
+    """Event loop clock that can be moved forward without waiting."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._real_time = loop.time
+        self._offset = 0.0
+
+    def time(self) -> float:
+        """Return the loop time, including any simulated advance."""
+        return self._real_time() + self._offset
+
+    async def advance(self, seconds: float) -> None:
+        """Move the clock forward and let the loop run callbacks that became due.
+
+        The loop moves all due timers to its ready queue in one pass, behind this
+        coroutine, so they run right after it resumes. A task that a timer creates
+        takes its first step one pass later. Three passes cover both.
+        """
+        self._offset += seconds
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+
+@pytest.fixture
+async def clock(monkeypatch: pytest.MonkeyPatch) -> VirtualClock:
+    """Replace the running loop's clock so timer tests need not sleep.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Used to restore the loop's clock after the test
+
+    Returns
+    -------
+    VirtualClock
+        Clock driving the event loop for this test
+
+    """
+    loop = asyncio.get_running_loop()
+    virtual_clock = VirtualClock(loop)
+    monkeypatch.setattr(loop, "time", virtual_clock.time)
+    return virtual_clock
+
+
 async def test_refresh_starts_timer():
     """Test that refresh() starts the timer."""
     callback_called = False
@@ -40,16 +83,22 @@ async def test_refresh_starts_timer():
     timer.stop()
 
 
-@pytest.mark.asyncio
-async def test_refresh_restarts_timer():
+async def test_refresh_restarts_timer(clock: VirtualClock):
     """Test that refresh() restarts the timer, cancelling the previous countdown."""
-    timer = GraceTimer(grace_period_seconds=0.2, on_expire=noop)
+    expire_count = 0
+
+    async def on_expire(_timestamp):
+        nonlocal expire_count
+        expire_count += 1
+
+    timer = GraceTimer(grace_period_seconds=10, on_expire=on_expire)
 
     timer.refresh()
     first_refresh = timer.last_refresh
     assert first_refresh is not None
 
-    await asyncio.sleep(0.05)
+    await clock.advance(5)
+    await asyncio.sleep(0.001)  # Real time, so that refresh timestamps differ
 
     timer.refresh()
     second_refresh = timer.last_refresh
@@ -58,14 +107,29 @@ async def test_refresh_restarts_timer():
     assert second_refresh > first_refresh
     assert timer.is_running
 
-    # Wait past original expiry time but not past restarted expiry
-    await asyncio.sleep(0.1)
+    # Move past original expiry time but not past restarted expiry
+    await clock.advance(7)
     assert timer.is_running
+    assert expire_count == 0
+
+    # Move past restarted expiry
+    await clock.advance(3)
+    await timer.wait()
+    assert expire_count == 1
+
+
+async def test_refresh_creates_no_tasks():
+    """Test that refreshing the countdown does not spawn a task per call."""
+    timer = GraceTimer(grace_period_seconds=10, on_expire=noop)
+    task_count = len(asyncio.all_tasks())
 
+    for _ in range(100):
+        timer.refresh()
+
+    assert len(asyncio.all_tasks()) == task_count
     timer.stop()
 
 
-@pytest.mark.asyncio
 async def test_stop_stops_timer():
     """Test that stop() stops the timer."""
     timer = GraceTimer(grace_period_seconds=10, on_expire=noop)
@@ -78,7 +142,6 @@ async def test_stop_stops_timer():
     assert not timer.is_running
 
 
-@pytest.mark.asyncio
 async def test_stop_is_idempotent():
     """Test that stop() can be called multiple times safely."""
     timer = GraceTimer(grace_period_seconds=10, on_expire=noop)
@@ -97,8 +160,7 @@ async def test_stop_is_idempotent():
     assert not timer.is_running
 
 
-@pytest.mark.asyncio
-async def test_expiry_calls_callback_with_timestamp():
+async def test_expiry_calls_callback_with_timestamp(clock: VirtualClock):
     """Test that timer expiry calls on_expire with the last_refresh timestamp."""
     received_timestamp = None
 
@@ -106,24 +168,47 @@ async def test_expiry_calls_callback_with_timestamp():
         nonlocal received_timestamp
         received_timestamp = timestamp
 
-    timer = GraceTimer(grace_period_seconds=0.05, on_expire=on_expire)
+    timer = GraceTimer(grace_period_seconds=10, on_expire=on_expire)
 
     timer.refresh()
     expected_timestamp = timer.last_refresh
 
-    await asyncio.sleep(0.1)
+    await clock.advance(10)
+    await timer.wait()
 
     assert received_timestamp == expected_timestamp
 
 
-@pytest.mark.asyncio
-async def test_expiry_clears_running_state():
+async def test_expiry_clears_running_state(clock: VirtualClock):
     """Test that timer expiry sets is_running to False."""
-    timer = GraceTimer(grace_period_seconds=0.05, on_expire=noop)
+    timer = GraceTimer(grace_period_seconds=10, on_expire=noop)
 
     timer.refresh()
     assert timer.is_running
 
-    await asyncio.sleep(0.1)
+    await clock.advance(10)
+    await timer.wait()
 
     assert not timer.is_running
+
+
+async def test_wait_returns_when_timer_stopped():
+    """Test that wait() returns without expiry if the timer is stopped."""
+    callback_called = False
+
+    async def on_expire(_timestamp):
+        nonlocal callback_called
+        callback_called = True
+
+    timer = GraceTimer(grace_period_seconds=10, on_expire=on_expire)
+
+    # Not running: returns immediately
+    await timer.wait()
+
+    timer.refresh()
+    waiter = asyncio.create_task(timer.wait())
+    await asyncio.sleep(0)
+    timer.stop()
+
+    await asyncio.wait_for(waiter, timeout=1)
+    assert not callback_called
@@ -1,7 +1,10 @@
 """Unit tests for image processing service."""
 
 import asyncio
+import errno
+from functools import cache
 from io import BytesIO
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
@@ -12,9 +15,14 @@ from chitai.image_processing import (
     ImageDownloadError,
     InsufficientStorageError,
     InvalidImageError,
+    _get_client,
+    close_shared_client,
     fetch_image_from_url,
+    format_from_content_type,
     process_image,
+    process_image_with_thumbnail,
     save_image_file,
+    save_image_file_async,
 )
 
 # Test constants
@@ -23,8 +31,9 @@ THUMBNAIL_SIZE = 200
 QUALITY = 85
 
 
+@cache
 def create_test_image(width: int, height: int, image_format: str = "PNG") -> bytes:
-    """Create a test image in memory."""
+    """Create a test image in memory, encoding each size and format only once."""
     image = Image.new("RGB", (width, height), color="red")
     output = BytesIO()
     image.save(output, format=image_format)
@@ -122,6 +131,92 @@ class TestProcessImage:
         image = Image.open(BytesIO(result.data))
         assert image.format == "WEBP"
 
+    @pytest.mark.parametrize(
+        ("img_format", "hint_format"),
+        [
+            ("JPEG", "JPEG"),  # Correct hint
+            ("PNG", "JPEG"),  # Wrong hint falls back to format detection
+            ("PNG", "JPG"),  # Unknown format name is ignored
+        ],
+    )
+    def test_hint_format(self, img_format, hint_format):
+        """Should decode the image whether or not the format hint is right."""
+        image_data = create_test_image(400, 300, image_format=img_format)
+
+        result = process_image(
+            image_data, MAX_DIMENSION, QUALITY, hint_format=hint_format
+        )
+
+        assert (result.width, result.height) == (400, 300)
+
+    @pytest.mark.parametrize(
+        ("img_format", "hint_format", "expected_formats"),
+        [
+            ("JPEG", "JPEG", [("JPEG",)]),  # Correct hint, no detection needed
+            ("PNG", "JPEG", [("JPEG",), None]),  # Wrong hint, falls back
+            ("PNG", "JPG", [("JPG",), None]),  # Unknown format name, falls back
+        ],
+    )
+    def test_hint_format_tried_first(self, img_format, hint_format, expected_formats):
+        """Should open with the hinted format first and fall back to detection."""
+        image_data = create_test_image(400, 300, image_format=img_format)
+
+        with patch.object(Image, "open", wraps=Image.open) as mock_open:
+            process_image(image_data, MAX_DIMENSION, QUALITY, hint_format=hint_format)
+
+        formats = [call.kwargs.get("formats") for call in mock_open.call_args_list]
+        assert formats == expected_formats
+
+    @pytest.mark.parametrize(
+        ("content_type", "expected"),
+        [
+            ("image/jpeg", "JPEG"),
+            ("image/PNG; charset=binary", "PNG"),
+            ("image/x-unknown", None),
+            (None, None),
+        ],
+    )
+    def test_format_from_content_type(self, content_type, expected):
+        """Should map known image content types to Pillow format names."""
+        assert format_from_content_type(content_type) == expected
+
+
+class TestProcessImageWithThumbnail:
+    """Tests for process_image_with_thumbnail function."""
+
+    def test_both_variants(self):
+        """Should produce a full-size image and a thumbnail, both as WebP."""
+        image_data = create_test_image(2000, 1500)
+
+        full_image, thumbnail = process_image_with_thumbnail(
+            image_data, MAX_DIMENSION, THUMBNAIL_SIZE, QUALITY
+        )
+
+        assert (full_image.width, full_image.height) == (MAX_DIMENSION, 900)
+        assert (thumbnail.width, thumbnail.height) == (THUMBNAIL_SIZE, 150)
+        for variant in (full_image, thumbnail):
+            image = Image.open(BytesIO(variant.data))
+            assert image.format == "WEBP"
+            assert image.size == (variant.width, variant.height)
+
+    def test_decodes_source_once(self):
+        """Should open the source image only once for both variants."""
+        image_data = create_test_image(800, 600)
+
+        with patch.object(Image, "open", wraps=Image.open) as mock_open:
+            process_image_with_thumbnail(
+                image_data, MAX_DIMENSION, THUMBNAIL_SIZE, QUALITY
+            )
+
+        mock_open.assert_called_once()
+
+    def test_invalid_image_data(self):
+        """Invalid image data should raise InvalidImageError."""
+        with pytest.raises(InvalidImageError, match="Invalid or unsupported"):
+            process_image_with_thumbnail(
+                b"not an image", MAX_DIMENSION, THUMBNAIL_SIZE, QUALITY
+            )
+
 
 class TestSaveImageFile:
     """Tests for save_image_file function."""
@@ -144,35 +239,51 @@ class TestSaveImageFile:
         assert file_path.exists()
         assert file_path.read_bytes() == b"image data"
 
+    def test_save_overwrites_existing_file(self, tmp_path):
+        """Should replace the contents of an existing file."""
+        file_path = tmp_path / "test.webp"
+        file_path.write_bytes(b"old and longer data")
+
+        save_image_file(file_path, b"new data")
+
+        assert file_path.read_bytes() == b"new data"
+
     def test_save_insufficient_space(self, tmp_path):
         """Should raise InsufficientStorageError on disk full."""
         file_path = tmp_path / "test.webp"
 
-        with patch("pathlib.Path.write_bytes") as mock_write:
-            mock_write.side_effect = OSError(28, "No space left on device")
+        with patch("os.write") as mock_write:
+            mock_write.side_effect = OSError(errno.ENOSPC, "No space left on device")
 
             with pytest.raises(InsufficientStorageError, match="Not enough disk space"):
                 save_image_file(file_path, b"data")
 
+    async def test_save_async(self, tmp_path):
+        """Should save file from async code."""
+        file_path = tmp_path / "new_dir" / "test.webp"
+
+        await save_image_file_async(file_path, b"image data")
+
+        assert file_path.read_bytes() == b"image data"
+
 
 class TestFetchImageFromUrl:
     """Tests for fetch_image_from_url function."""
 
     @pytest.fixture
     def mock_httpx_client(self):
-        """Create a mock httpx AsyncClient."""
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+        """Replace the shared httpx AsyncClient with a lightweight stub.
+
+        Tests assign the stub's get attribute to control the response.
+        """
+        mock_client = SimpleNamespace(get=AsyncMock())
+        with patch("chitai.image_processing._shared_client.client", mock_client):
             yield mock_client
 
-    @pytest.mark.asyncio
     async def test_fetch_successful(self, mock_httpx_client):
         """Should fetch image data from valid URL."""
         test_data = b"image data"
-        mock_response = Mock()
-        mock_response.content = test_data
-        mock_response.raise_for_status = Mock()
+        mock_response = SimpleNamespace(content=test_data, raise_for_status=Mock())
 
         mock_httpx_client.get = AsyncMock(return_value=mock_response)
 
@@ -181,13 +292,11 @@ class TestFetchImageFromUrl:
         assert result == test_data
         mock_response.raise_for_status.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_fetch_timeout(self, mock_httpx_client):
         """Timeout should be handled by caller with asyncio.timeout()."""
 
         async def slow_get(*_args, **_kwargs):
             await asyncio.sleep(10)
-            return Mock()
 
         mock_httpx_client.get = slow_get
 
@@ -195,7 +304,6 @@ class TestFetchImageFromUrl:
             async with asyncio.timeout(0.1):
                 await fetch_image_from_url("http://example.com/image.jpg")
 
-    @pytest.mark.asyncio
     async def test_fetch_http_error(self, mock_httpx_client):
         """Should raise ImageDownloadError on HTTP error."""
 
@@ -207,3 +315,29 @@ class TestFetchImageFromUrl:
 
         with pytest.raises(ImageDownloadError, match="Could not fetch"):
             await fetch_image_from_url("http://example.com/image.jpg")
+
+    async def test_fetch_with_explicit_client(self, mock_httpx_client):
+        """Should use the given client instead of the shared one."""
+        mock_response = SimpleNamespace(content=b"image data", raise_for_status=Mock())
+        client = Mock(spec=httpx.AsyncClient)
+        client.get = AsyncMock(return_value=mock_response)
+
+        result = await fetch_image_from_url(
+            "http://example.com/image.jpg", client=client
+        )
+
+        assert result == b"image data"
+        client.get.assert_awaited_once()
+        mock_httpx_client.get.assert_not_called()
+
+    async def test_shared_client_is_reused(self):
+        """Should create the shared client once and reuse it until closed."""
+        with patch("chitai.image_processing._shared_client.client", None):
+            first = _get_client()
+            assert _get_client() is first
+
+            await close_shared_client()
+
+            assert first.is_closed
+            assert _get_client() is not first
+            await close_shared_client()
@@ -1,6 +1,6 @@
 """Unit tests for language processing."""
 
-from chitai.language import sanitize, syllabify, tokenize
+from chitai.language import _syllabify, sanitize, syllabify, tokenize
 
 
 def test_sanitize_removes_punctuation():
@@ -48,3 +48,15 @@ def test_syllabify_returns_list():
     assert isinstance(result, list)
     assert len(result) > 0
     assert all(isinstance(syl, str) for syl in result)
+
+
+def test_syllabify_is_cached():
+    """Test that repeated syllabification is served from the cache."""
+    syllabify("молоко")
+    hits = _syllabify.cache_info().hits
+
+    result = syllabify("молоко")
+    result.append("x")
+
+    assert _syllabify.cache_info().hits == hits + 1
+    assert syllabify("молоко") == ["мо", "ло", "ко"]
@@ -1,14 +1,14 @@
 """Unit tests for database models."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
+from uuid import UUID
 
 import pytest
-from sqlalchemy import create_engine, func, select
+from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
 
-from chitai.db.base import Base
 from chitai.db.models import (
     Illustration,
     Item,
@@ -22,25 +22,56 @@ from chitai.db.models import Session as DBSession
 if TYPE_CHECKING:
     from collections.abc import Generator
 
+    from sqlalchemy import Engine
     from sqlalchemy.orm import Session
 
+# Fixed timestamp for rows that need one, so tests never depend on the wall clock
+DISPLAYED_AT = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+
 
 @pytest.fixture
-def session() -> Generator[Session]:
+def session(fresh_db: Engine) -> Generator[Session]:
     """Create an in-memory SQLite database for testing.
 
+    Parameters
+    ----------
+    fresh_db : Engine
+        Engine for a fresh copy of the template database from fresh_db fixture
+
     Yields
     ------
     Session
         SQLAlchemy session with clean schema
     """
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    session_factory = sessionmaker(bind=engine)
-    session = session_factory()
+    session = sessionmaker(bind=fresh_db)()
     yield session
     session.close()
-    engine.dispose()
+
+
+@pytest.fixture
+def linked_item(session: Session) -> tuple[Item, Illustration]:
+    """Create an item linked to one illustration.
+
+    Parameters
+    ----------
+    session : Session
+        Database session from session fixture
+
+    Returns
+    -------
+    tuple[Item, Illustration]
+        The committed item and illustration
+    """
+    item = Item(language=Language.RUSSIAN, text="собака")
+    illustration = Illustration(width=800, height=600, file_size_bytes=12345)
+    session.add_all([item, illustration])
+    session.flush()
+
+    link = ItemIllustration(item_id=item.id, illustration_id=illustration.id)
+    session.add(link)
+    session.commit()
+
+    return item, illustration
 
 
 def test_item_creation(session: Session) -> None:
@@ -55,6 +86,7 @@ def test_item_creation(session: Session) -> None:
     assert retrieved.language == Language.RUSSIAN
     assert isinstance(retrieved.created_at, datetime)
     assert len(retrieved.id) == 36  # UUID string length
+    assert UUID(retrieved.id).version == 7  # Time-ordered for index locality
 
 
 def test_item_unique_constraint(session: Session) -> None:
@@ -100,8 +132,8 @@ def test_session_end(session: Session) -> None:
     session.add(db_session)
     session.commit()
 
-    # End the session
-    db_session.ended_at = datetime.now(UTC)
+    # End the session a minute after it started, so ordering never depends on timing
+    db_session.ended_at = db_session.started_at + timedelta(minutes=1)
     session.commit()
 
     retrieved = session.scalars(select(DBSession)).first()
@@ -115,9 +147,8 @@ def test_session_item_creation(session: Session) -> None:
     # Create item and session
     item = Item(language=Language.RUSSIAN, text="молоко")
     db_session = DBSession(language=Language.RUSSIAN)
-    session.add(item)
-    session.add(db_session)
-    session.commit()
+    session.add_all([item, db_session])
+    session.flush()
 
     # Create session item (not displayed yet)
     session_item = SessionItem(session_id=db_session.id, item_id=item.id)
@@ -139,9 +170,8 @@ def test_session_item_relationships(session: Session) -> None:
     # Create item and session
     item = Item(language=Language.RUSSIAN, text="молоко")
     db_session = DBSession(language=Language.RUSSIAN)
-    session.add(item)
-    session.add(db_session)
-    session.commit()
+    session.add_all([item, db_session])
+    session.flush()
 
     # Create session item
     session_item = SessionItem(session_id=db_session.id, item_id=item.id)
@@ -166,18 +196,17 @@ def test_session_item_completion(session: Session) -> None:
     item = Item(language=Language.RUSSIAN, text="молоко")
     db_session = DBSession(language=Language.RUSSIAN)
     session.add_all([item, db_session])
-    session.commit()
+    session.flush()
 
     # Create session item and mark as displayed
-    now = datetime.now(UTC)
     session_item = SessionItem(
-        session_id=db_session.id, item_id=item.id, displayed_at=now
+        session_id=db_session.id, item_id=item.id, displayed_at=DISPLAYED_AT
     )
     session.add(session_item)
     session.commit()
 
     # Mark as completed
-    session_item.completed_at = datetime.now(UTC)
+    session_item.completed_at = DISPLAYED_AT + timedelta(seconds=5)
     session.commit()
 
     retrieved = session.scalars(select(SessionItem)).first()
@@ -192,7 +221,7 @@ def test_session_cascade_delete(session: Session) -> None:
     item = Item(language=Language.RUSSIAN, text="молоко")
     db_session = DBSession(language=Language.RUSSIAN)
     session.add_all([item, db_session])
-    session.commit()
+    session.flush()
 
     # Create session item with persisted IDs
     session_item = SessionItem(session_id=db_session.id, item_id=item.id)
@@ -289,7 +318,7 @@ def test_item_illustration_creation(session: Session) -> None:
     item = Item(language=Language.RUSSIAN, text="собака")
     illustration = Illustration(width=800, height=600, file_size_bytes=12345)
     session.add_all([item, illustration])
-    session.commit()
+    session.flush()
 
     link = ItemIllustration(item_id=item.id, illustration_id=illustration.id)
     session.add(link)
@@ -302,16 +331,11 @@ def test_item_illustration_creation(session: Session) -> None:
     assert len(retrieved_link.id) == 36
 
 
-def test_item_illustration_relationships(session: Session) -> None:
+def test_item_illustration_relationships(
+    session: Session, linked_item: tuple[Item, Illustration]
+) -> None:
     """Test ItemIllustration relationships to Item and Illustration."""
-    item = Item(language=Language.RUSSIAN, text="собака")
-    illustration = Illustration(width=800, height=600, file_size_bytes=12345)
-    session.add_all([item, illustration])
-    session.commit()
-
-    link = ItemIllustration(item_id=item.id, illustration_id=illustration.id)
-    session.add(link)
-    session.commit()
+    item, illustration = linked_item
 
     retrieved_link = session.scalars(select(ItemIllustration)).first()
     assert retrieved_link is not None
@@ -331,7 +355,7 @@ def test_multiple_illustrations_per_item(session: Session) -> None:
     illustration1 = Illustration(width=800, height=600, file_size_bytes=12345)
     illustration2 = Illustration(width=1024, height=768, file_size_bytes=54321)
     session.add_all([item, illustration1, illustration2])
-    session.commit()
+    session.flush()
 
     link1 = ItemIllustration(item_id=item.id, illustration_id=illustration1.id)
     link2 = ItemIllustration(item_id=item.id, illustration_id=illustration2.id)
@@ -349,7 +373,7 @@ def test_multiple_items_per_illustration(session: Session) -> None:
     item2 = Item(language=Language.RUSSIAN, text="кошка")
     illustration = Illustration(width=800, height=600, file_size_bytes=12345)
     session.add_all([item1, item2, illustration])
-    session.commit()
+    session.flush()
 
     link1 = ItemIllustration(item_id=item1.id, illustration_id=illustration.id)
     link2 = ItemIllustration(item_id=item2.id, illustration_id=illustration.id)
@@ -361,16 +385,11 @@ def test_multiple_items_per_illustration(session: Session) -> None:
     assert texts == {"собака", "кошка"}
 
 
-def test_illustration_cascade_delete(session: Session) -> None:
+def test_illustration_cascade_delete(
+    session: Session, linked_item: tuple[Item, Illustration]
+) -> None:
     """Test that deleting an illustration deletes item_illustrations but not items."""
-    item = Item(language=Language.RUSSIAN, text="собака")
-    illustration = Illustration(width=800, height=600, file_size_bytes=12345)
-    session.add_all([item, illustration])
-    session.commit()
-
-    link = ItemIllustration(item_id=item.id, illustration_id=illustration.id)
-    session.add(link)
-    session.commit()
+    _, illustration = linked_item
 
     # Delete illustration
     session.delete(illustration)
@@ -382,16 +401,11 @@ def test_illustration_cascade_delete(session: Session) -> None:
     assert session.scalar(select(func.count()).select_from(Item)) == 1
 
 
-def test_item_cascade_delete_with_illustrations(session: Session) -> None:
+def test_item_cascade_delete_with_illustrations(
+    session: Session, linked_item: tuple[Item, Illustration]
+) -> None:
     """Test that deleting an item deletes item_illustrations but not illustrations."""
-    item = Item(language=Language.RUSSIAN, text="собака")
-    illustration = Illustration(width=800, height=600, file_size_bytes=12345)
-    session.add_all([item, illustration])
-    session.commit()
-
-    link = ItemIllustration(item_id=item.id, illustration_id=illustration.id)
-    session.add(link)
-    session.commit()
+    item, _ = linked_item
 
     # Delete item
     session.delete(item)
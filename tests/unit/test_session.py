@@ -17,7 +17,7 @@ def test_initial_state(session):
     assert session.language is None
     assert session.current_session_item_id is None
     assert session.current_illustration_id is None
-    assert session.queue == []
+    assert not session.queue
     assert session.words == []
     assert session.current_word_index is None
 
@@ -106,7 +106,7 @@ def test_reset_clears_state(session):
     session.language = "ru"
     session.current_session_item_id = "test-session-item-id"
     session.current_illustration_id = "test-illustration-id"
-    session.queue = ["queued-item-1", "queued-item-2"]
+    session.queue.extend(["queued-item-1", "queued-item-2"])
     session.words = ["один", "два"]
     session.current_word_index = 1
     session.reset()
@@ -114,6 +114,6 @@ def test_reset_clears_state(session):
     assert session.language is None
     assert session.current_session_item_id is None
     assert session.current_illustration_id is None
-    assert session.queue == []
+    assert not session.queue
     assert session.words == []
     assert session.current_word_index is None